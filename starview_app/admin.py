@@ -1281,6 +1281,31 @@ class CustomUserAdmin(BaseUserAdmin):
     view_badges.short_description = 'User Badges'
 
 
+
+# ----------------------------------------------------------------------------- #
+# Custom admin interface for UserProfile model.                                 #
+#                                                                               #
+# Shows the denormalized activity counters read-only (signals.py maintains      #
+# them with F() updates), and saves only the fields changed in the form so an   #
+# edit never writes back counter values loaded before a concurrent increment.   #
+# ----------------------------------------------------------------------------- #
+class UserProfileAdmin(admin.ModelAdmin):
+    readonly_fields = [
+        'visit_count',
+        'locations_added_count',
+        'follower_count',
+        'other_comment_count',
+        'photo_count',
+    ]
+
+    def save_model(self, request, obj, form, change):
+        if not change:
+            super().save_model(request, obj, form, change)
+        elif form.changed_data:
+            obj.save(update_fields=[*form.changed_data, 'updated_at'])
+
+
+
 # ----------------------------------------------------------------------------------------------------- #
 #                                                                                                       #
 #                                          ADMIN SITE REGISTERS                                         #
@@ -1289,7 +1314,7 @@ class CustomUserAdmin(BaseUserAdmin):
 
 # Register models with basic admin interface
 admin.site.register(Location)
-admin.site.register(UserProfile)
+admin.site.register(UserProfile, UserProfileAdmin)
 admin.site.register(FavoriteLocation)
 admin.site.register(Review)
 admin.site.register(ReviewComment)
@@ -238,48 +238,50 @@ class Command(BaseCommand):
 
             elif badge.category == 'REVIEW':
                 # Check review-related criteria
-                from django.contrib.contenttypes.models import ContentType
+                from django.db.models import Count, Q
                 from starview_app.models import Vote
+                from starview_app.utils.signals import get_review_content_type
 
-                user_reviews = Review.objects.filter(user=user)
-                review_count = user_reviews.count()
+                # Evaluate review IDs once: the count is their length, and the vote
+                # filter takes the list directly instead of an IN (SELECT ...) subquery
+                review_ids = list(Review.objects.filter(user=user).values_list('id', flat=True))
+                review_count = len(review_ids)
 
                 if badge.criteria_type == 'REVIEWS_WRITTEN':
                     if review_count < badge.criteria_value:
                         should_revoke = True
                         reason = f"Has {review_count} reviews, needs {badge.criteria_value}"
 
-                elif badge.criteria_type == 'UPVOTES_RECEIVED':
-                    review_ct = ContentType.objects.get_for_model(Review)
-                    user_review_ids = user_reviews.values_list('id', flat=True)
-                    upvote_count = Vote.objects.filter(
-                        content_type=review_ct,
-                        object_id__in=user_review_ids,
-                        is_upvote=True
-                    ).count()
-
-                    if upvote_count < badge.criteria_value:
-                        should_revoke = True
-                        reason = f"Has {upvote_count} upvotes, needs {badge.criteria_value}"
-
-                elif badge.criteria_type == 'HELPFUL_RATIO':
-                    review_ct = ContentType.objects.get_for_model(Review)
-                    user_review_ids = user_reviews.values_list('id', flat=True)
-                    votes_on_reviews = Vote.objects.filter(
-                        content_type=review_ct,
-                        object_id__in=user_review_ids
-                    )
-
-                    upvote_count = votes_on_reviews.filter(is_upvote=True).count()
-                    total_votes = votes_on_reviews.count()
-                    helpful_ratio = (upvote_count / total_votes * 100) if total_votes > 0 else 0
-
-                    min_reviews = badge.criteria_value
-                    min_ratio = badge.criteria_secondary
-
-                    if review_count < min_reviews or helpful_ratio < min_ratio:
-                        should_revoke = True
-                        reason = f"Has {review_count} reviews (needs {min_reviews}) with {helpful_ratio:.1f}% helpful (needs {min_ratio}%)"
+                elif badge.criteria_type in ('UPVOTES_RECEIVED', 'HELPFUL_RATIO'):
+                    # Upvotes and total votes in one aggregate (no Vote query without reviews)
+                    if review_ids:
+                        vote_stats = Vote.objects.filter(
+                            content_type=get_review_content_type(),
+                            object_id__in=review_ids
+                        ).aggregate(
+                            upvote_count=Count('id', filter=Q(is_upvote=True)),
+                            total_votes=Count('id')
+                        )
+                    else:
+                        vote_stats = {'upvote_count': 0, 'total_votes': 0}
+
+                    upvote_count = vote_stats['upvote_count']
+                    total_votes = vote_stats['total_votes']
+
+                    if badge.criteria_type == 'UPVOTES_RECEIVED':
+                        if upvote_count < badge.criteria_value:
+                            should_revoke = True
+                            reason = f"Has {upvote_count} upvotes, needs {badge.criteria_value}"
+
+                    else:
+                        helpful_ratio = (upvote_count / total_votes * 100) if total_votes > 0 else 0
+
+                        min_reviews = badge.criteria_value
+                        min_ratio = badge.criteria_secondary
+
+                        if review_count < min_reviews or helpful_ratio < min_ratio:
+                            should_revoke = True
+                            reason = f"Has {review_count} reviews (needs {min_reviews}) with {helpful_ratio:.1f}% helpful (needs {min_ratio}%)"
 
             elif badge.category == 'COMMUNITY':
                 # Check community engagement
@@ -9,7 +9,7 @@ Usage:
     python manage.py enrich_locations --dry-run
     python manage.py enrich_locations --id 123
     python manage.py enrich_locations --type observatory
-    python manage.py enrich_locations --elevation-only
+    python manage.py enrich_locations --elevation-only   # Batched: one tile download per Terrain-DEM tile
 """
 
 import time
@@ -90,54 +90,60 @@ class Command(BaseCommand):
         geocode_failed = 0
         elevation_failed = 0
 
-        for i, location in enumerate(locations, 1):
-            self.stdout.write(f'[{i}/{total}] {location.name} (ID: {location.id})')
-            self.stdout.write(f'  Coords: {location.latitude}, {location.longitude}')
-            self.stdout.write(f'  Before: {location.formatted_address or "(empty)"}, {location.elevation}m')
+        if elevation_only and not dry_run:
+            # Batch path: locations are grouped by Terrain-DEM tile, so each tile is
+            # downloaded once and all elevations are saved with one bulk_update
+            success_count = LocationService.bulk_update_elevation(locations)
+            elevation_failed = total - success_count
+        else:
+            for i, location in enumerate(locations, 1):
+                self.stdout.write(f'[{i}/{total}] {location.name} (ID: {location.id})')
+                self.stdout.write(f'  Coords: {location.latitude}, {location.longitude}')
+                self.stdout.write(f'  Before: {location.formatted_address or "(empty)"}, {location.elevation}m')
+
+                if dry_run:
+                    self.stdout.write(self.style.WARNING('  Skipped (dry run)'))
+                    continue
+
+                # Run geocoding (skip if elevation_only)
+                geocode_success = False
+                if not elevation_only:
+                    try:
+                        geocode_success = LocationService.update_address_from_coordinates(location)
+                        if geocode_success:
+                            location.refresh_from_db()
+                            self.stdout.write(self.style.SUCCESS(
+                                f'  Geocoded: {location.formatted_address}'
+                            ))
+                        else:
+                            self.stdout.write(self.style.WARNING('  Geocoding: No data returned'))
+                            geocode_failed += 1
+                    except Exception as e:
+                        self.stdout.write(self.style.ERROR(f'  Geocoding error: {e}'))
+                        geocode_failed += 1
 
-            if dry_run:
-                self.stdout.write(self.style.WARNING('  Skipped (dry run)'))
-                continue
+                    time.sleep(delay)
 
-            # Run geocoding (skip if elevation_only)
-            geocode_success = False
-            if not elevation_only:
+                # Run elevation
+                elevation_success = False
                 try:
-                    geocode_success = LocationService.update_address_from_coordinates(location)
-                    if geocode_success:
+                    elevation_success = LocationService.update_elevation_from_mapbox(location)
+                    if elevation_success:
                         location.refresh_from_db()
                         self.stdout.write(self.style.SUCCESS(
-                            f'  Geocoded: {location.formatted_address}'
+                            f'  Elevation: {location.elevation}m'
                         ))
                     else:
-                        self.stdout.write(self.style.WARNING('  Geocoding: No data returned'))
-                        geocode_failed += 1
+                        self.stdout.write(self.style.WARNING('  Elevation: No data returned'))
+                        elevation_failed += 1
                 except Exception as e:
-                    self.stdout.write(self.style.ERROR(f'  Geocoding error: {e}'))
-                    geocode_failed += 1
-
-                time.sleep(delay)
-
-            # Run elevation
-            elevation_success = False
-            try:
-                elevation_success = LocationService.update_elevation_from_mapbox(location)
-                if elevation_success:
-                    location.refresh_from_db()
-                    self.stdout.write(self.style.SUCCESS(
-                        f'  Elevation: {location.elevation}m'
-                    ))
-                else:
-                    self.stdout.write(self.style.WARNING('  Elevation: No data returned'))
+                    self.stdout.write(self.style.ERROR(f'  Elevation error: {e}'))
                     elevation_failed += 1
-            except Exception as e:
-                self.stdout.write(self.style.ERROR(f'  Elevation error: {e}'))
-                elevation_failed += 1
 
-            if geocode_success or elevation_success:
-                success_count += 1
+                if geocode_success or elevation_success:
+                    success_count += 1
 
-            time.sleep(delay)
+                time.sleep(delay)
 
         # Summary
         self.stdout.write(f'\n{"=" * 60}')
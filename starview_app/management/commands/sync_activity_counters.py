@@ -0,0 +1,35 @@
+"""
+Management command to recompute denormalized activity counters on UserProfile.
+
+The counters (visits, locations added, followers, comments on other users'
+reviews, photos) are maintained incrementally by signals.py and backfilled by
+migration 0036. This command rebuilds them from the source tables, e.g. after
+bulk operations that bypass model signals (queryset.update(), raw SQL).
+
+Usage:
+    python manage.py sync_activity_counters              # Recompute for all users
+    python manage.py sync_activity_counters --user stony # Recompute for one user
+"""
+
+from django.core.management.base import BaseCommand
+from starview_app.models import UserProfile
+from starview_app.services.badge_service import BadgeService
+
+
+class Command(BaseCommand):
+    help = 'Recompute denormalized activity counters on user profiles'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--user',
+            type=str,
+            help='Recompute counters for a specific user only (username)',
+        )
+
+    def handle(self, *args, **options):
+        profiles = UserProfile.objects.all()
+        if options.get('user'):
+            profiles = profiles.filter(user__username=options['user'])
+
+        updated = BadgeService.sync_activity_counters(profiles)
+        self.stdout.write(self.style.SUCCESS(f"Recomputed activity counters for {updated} profile(s)"))
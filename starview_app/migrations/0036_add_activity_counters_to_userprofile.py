@@ -0,0 +1,73 @@
+# Adds denormalized activity counters to UserProfile (read by badge checks) and
+# backfills them from the existing rows. signals.py keeps them in sync afterwards;
+# `manage.py sync_activity_counters` recomputes them if they ever drift.
+
+from django.db import migrations, models
+from django.db.models import F, Func, IntegerField, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def _count(queryset):
+    counted = queryset.order_by().annotate(_count=Func(F('pk'), function='COUNT')).values('_count')
+    return Coalesce(Subquery(counted, output_field=IntegerField()), 0)
+
+
+def backfill_activity_counters(apps, schema_editor):
+    """Populate every profile's counters with correlated COUNT subqueries (one UPDATE)."""
+    UserProfile = apps.get_model('starview_app', 'UserProfile')
+    LocationVisit = apps.get_model('starview_app', 'LocationVisit')
+    Location = apps.get_model('starview_app', 'Location')
+    Follow = apps.get_model('starview_app', 'Follow')
+    ReviewComment = apps.get_model('starview_app', 'ReviewComment')
+    ReviewPhoto = apps.get_model('starview_app', 'ReviewPhoto')
+    LocationPhoto = apps.get_model('starview_app', 'LocationPhoto')
+
+    user_ref = OuterRef('user_id')
+    UserProfile.objects.update(
+        visit_count=_count(LocationVisit.objects.filter(user_id=user_ref)),
+        locations_added_count=_count(Location.objects.filter(added_by_id=user_ref)),
+        follower_count=_count(Follow.objects.filter(following_id=user_ref)),
+        other_comment_count=_count(
+            ReviewComment.objects.filter(user_id=user_ref).exclude(review__user_id=user_ref)
+        ),
+        photo_count=(
+            _count(ReviewPhoto.objects.filter(review__user_id=user_ref)) +
+            _count(LocationPhoto.objects.filter(uploaded_by_id=user_ref))
+        ),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('starview_app', '0035_add_last_feedback_regenerated'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='userprofile',
+            name='visit_count',
+            field=models.IntegerField(default=0, help_text='Locations marked as visited'),
+        ),
+        migrations.AddField(
+            model_name='userprofile',
+            name='locations_added_count',
+            field=models.IntegerField(default=0, help_text='Locations added by this user'),
+        ),
+        migrations.AddField(
+            model_name='userprofile',
+            name='follower_count',
+            field=models.IntegerField(default=0, help_text='Users following this user'),
+        ),
+        migrations.AddField(
+            model_name='userprofile',
+            name='other_comment_count',
+            field=models.IntegerField(default=0, help_text="Comments written on other users' reviews"),
+        ),
+        migrations.AddField(
+            model_name='userprofile',
+            name='photo_count',
+            field=models.IntegerField(default=0, help_text='Review photos and location photos uploaded'),
+        ),
+        migrations.RunPython(backfill_activity_counters, migrations.RunPython.noop),
+    ]
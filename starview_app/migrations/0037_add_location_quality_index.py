@@ -0,0 +1,23 @@
+# Partial index backing the quality badge count (locations a user added that are
+# rated 4.0+), so it is answered from the index instead of filtering every
+# location the user added. Partial indexes are supported by PostgreSQL and SQLite.
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('starview_app', '0036_add_activity_counters_to_userprofile'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='location',
+            index=models.Index(
+                condition=models.Q(('average_rating__gte', 4.0)),
+                fields=['added_by'],
+                name='added_by_quality_idx',
+            ),
+        ),
+    ]
@@ -0,0 +1,39 @@
+# Marks the UserProfile activity counters as non-editable so model forms (including
+# the admin) no longer expose them or write back stale values. No schema change.
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('starview_app', '0037_add_location_quality_index'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='userprofile',
+            name='visit_count',
+            field=models.IntegerField(default=0, editable=False, help_text='Locations marked as visited'),
+        ),
+        migrations.AlterField(
+            model_name='userprofile',
+            name='locations_added_count',
+            field=models.IntegerField(default=0, editable=False, help_text='Locations added by this user'),
+        ),
+        migrations.AlterField(
+            model_name='userprofile',
+            name='follower_count',
+            field=models.IntegerField(default=0, editable=False, help_text='Users following this user'),
+        ),
+        migrations.AlterField(
+            model_name='userprofile',
+            name='other_comment_count',
+            field=models.IntegerField(default=0, editable=False, help_text="Comments written on other users' reviews"),
+        ),
+        migrations.AlterField(
+            model_name='userprofile',
+            name='photo_count',
+            field=models.IntegerField(default=0, editable=False, help_text='Review photos and location photos uploaded'),
+        ),
+    ]
@@ -17,7 +17,7 @@
 # ----------------------------------------------------------------------------------------------------- #
 
 # Import tools:
-from django.db import models
+from django.db import models, transaction
 from django.contrib.gis.db import models as gis_models
 from django.contrib.gis.geos import Point
 from django.contrib.auth.models import User
@@ -171,9 +171,11 @@ class Location(models.Model):
                 use_celery = getattr(settings, 'CELERY_ENABLED', False)
 
                 if use_celery:
-                    # Async enrichment via Celery (requires worker running)
+                    # Async enrichment via Celery (requires worker running), queued once
+                    # the current transaction commits so the worker can see the new row
                     from starview_app.utils.tasks import enrich_location_data
-                    enrich_location_data.delay(self.pk)
+                    location_id = self.pk
+                    transaction.on_commit(lambda: enrich_location_data.delay(location_id))
                     logger.info(
                         "Queued async enrichment task for location '%s' (ID: %d)",
                         self.name,
@@ -212,6 +214,12 @@ class Location(models.Model):
             models.Index(fields=['country'], name='country_idx'),
             models.Index(fields=['created_at'], name='created_at_idx'),
             models.Index(fields=['added_by'], name='added_by_idx'),
+            # Partial index for quality badge counts (creator's locations rated 4.0+):
+            models.Index(
+                fields=['added_by'],
+                condition=models.Q(average_rating__gte=4.0),
+                name='added_by_quality_idx'
+            ),
         ]
         ordering = ['-created_at']
         verbose_name = 'Location'
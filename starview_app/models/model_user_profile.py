@@ -9,6 +9,7 @@
 # - One-to-One relationship with User model (extends user functionality)                                #
 # - Profile picture upload with default fallback                                                        #
 # - Public profile fields: bio for user profiles                                                        #
+# - Activity counters (visits, locations, followers, comments, photos) read by badge checks             #
 # - Automatic creation: Signal handler in signals.py creates UserProfile when User is created           #
 # ----------------------------------------------------------------------------------------------------- #
 
@@ -74,6 +75,35 @@ class UserProfile(models.Model):
         help_text="User's preferred language for UI and emails"
     )
 
+    # Activity counters for badge checks (denormalized, kept in sync by signals.py).
+    # Not editable in forms/admin; only F() updates write them, so saves of other
+    # profile fields must pass update_fields to avoid writing back stale counts:
+    visit_count = models.IntegerField(
+        default=0,
+        editable=False,
+        help_text="Locations marked as visited"
+    )
+    locations_added_count = models.IntegerField(
+        default=0,
+        editable=False,
+        help_text="Locations added by this user"
+    )
+    follower_count = models.IntegerField(
+        default=0,
+        editable=False,
+        help_text="Users following this user"
+    )
+    other_comment_count = models.IntegerField(
+        default=0,
+        editable=False,
+        help_text="Comments written on other users' reviews"
+    )
+    photo_count = models.IntegerField(
+        default=0,
+        editable=False,
+        help_text="Review photos and location photos uploaded"
+    )
+
 
     # Returns profile picture URL or default if none set:
     @property
@@ -29,6 +29,7 @@ from .serializer_location import (
     LocationListSerializer,
     MapLocationSerializer,
     LocationInfoPanelSerializer,
+    recent_reviews_prefetch,
 )
 
 # User serializers:
@@ -37,6 +38,8 @@ from .serializer_user import (
     UserProfileSerializer,
     PublicUserSerializer,
     PrivateProfileSerializer,
+    public_user_values,
+    serialize_public_user_rows,
 )
 
 # Favorite location serializers:
@@ -66,12 +69,15 @@ __all__ = [
     'LocationListSerializer',
     'MapLocationSerializer',
     'LocationInfoPanelSerializer',
+    'recent_reviews_prefetch',
 
     # User serializers
     'UserSerializer',
     'UserProfileSerializer',
     'PublicUserSerializer',
     'PrivateProfileSerializer',
+    'public_user_values',
+    'serialize_public_user_rows',
 
     # Favorite location serializers
     'FavoriteLocationSerializer',
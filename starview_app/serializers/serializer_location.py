@@ -20,18 +20,46 @@
 
 # Import tools:
 from django.conf import settings
-from django.db.models import Avg
+from django.db.models import Avg, Prefetch, prefetch_related_objects
 from django.contrib.contenttypes.models import ContentType
 from rest_framework import serializers
 from ..models import Location
 from ..models import FavoriteLocation
 from ..models import LocationVisit
 from ..models import LocationPhoto
+from ..models import Review
 from ..models import ReviewPhoto
 from ..models import Vote
 from . import ReviewSerializer
 
 
+# Most recent reviews per location used to build the hybrid photo pool:
+RECENT_REVIEWS_PER_LOCATION = 5
+
+
+def recent_reviews_prefetch():
+    """
+    Returns a Prefetch that attaches each location's most recent reviews (with
+    their photos ordered by 'order') as `prefetched_reviews`.
+
+    The sliced queryset is compiled by Django into a ROW_NUMBER() window
+    partitioned by location_id, so every location gets at most
+    RECENT_REVIEWS_PER_LOCATION reviews in a single query regardless of how
+    many reviews it has.
+    """
+    return Prefetch(
+        'reviews',
+        queryset=Review.objects.select_related('user__userprofile').order_by('-created_at').prefetch_related(
+            Prefetch(
+                'photos',
+                queryset=ReviewPhoto.objects.order_by('order'),
+                to_attr='prefetched_photos'
+            )
+        )[:RECENT_REVIEWS_PER_LOCATION],
+        to_attr='prefetched_reviews'
+    )
+
+
 def get_user_attribution(user):
     """
     Returns user attribution data for photo overlays.
@@ -81,20 +109,14 @@ def get_images_with_votes(obj, request):
     else:
         location_photos = list(obj.photos.select_related('uploaded_by__userprofile').order_by('-created_at')[:10])
 
-    # 2. Collect all review photos
+    # 2. Collect review photos from the most recent reviews (bounded per location)
     review_photos_with_user = []
-    if hasattr(obj, 'prefetched_reviews'):
-        reviews = obj.prefetched_reviews
-    else:
-        reviews = obj.reviews.select_related('user__userprofile').prefetch_related('photos').order_by('-created_at')
+    if not hasattr(obj, 'prefetched_reviews'):
+        prefetch_related_objects([obj], recent_reviews_prefetch())
 
-    for review in reviews:
-        if hasattr(review, 'prefetched_photos'):
-            for photo in review.prefetched_photos:
-                review_photos_with_user.append((photo, review.user))
-        else:
-            for photo in review.photos.all().order_by('order'):
-                review_photos_with_user.append((photo, review.user))
+    for review in obj.prefetched_reviews:
+        for photo in review.prefetched_photos:
+            review_photos_with_user.append((photo, review.user))
 
     # 3. Get vote counts for all photos in batch
     loc_photo_ids = [p.id for p in location_photos]
@@ -197,17 +219,8 @@ def get_total_photo_count(obj):
     else:
         loc_count = obj.photos.count()
 
-    # Count review photos
-    rev_count = 0
-    if hasattr(obj, 'prefetched_reviews'):
-        for review in obj.prefetched_reviews:
-            if hasattr(review, 'prefetched_photos'):
-                rev_count += len(review.prefetched_photos)
-            else:
-                rev_count += review.photos.count()
-    else:
-        from ..models import ReviewPhoto
-        rev_count = ReviewPhoto.objects.filter(review__location=obj).count()
+    # Count review photos (prefetched_reviews is capped, so always count in the database)
+    rev_count = ReviewPhoto.objects.filter(review__location=obj).count()
 
     return loc_count + rev_count
 
@@ -0,0 +1,33 @@
+# ----------------------------------------------------------------------------------------------------- #
+# This serializer_mixins.py file defines reusable mixins shared by the domain serializers:              #
+#                                                                                                       #
+# Purpose:                                                                                              #
+# Holds small serializer behaviours that are not tied to a single model, so review, user and location   #
+# serializers can opt into them without importing each other.                                          #
+#                                                                                                       #
+# Key Features:                                                                                         #
+# - RepresentationCacheMixin: Memoizes to_representation per (serializer class, pk) for one response    #
+# ----------------------------------------------------------------------------------------------------- #
+
+
+
+# ----------------------------------------------------------------------------- #
+# Memoizes to_representation per (serializer class, pk) in the root serializer  #
+# context. An object that appears several times in one response (e.g. the same #
+# profile under many nested rows) is only serialized once.                      #
+#                                                                               #
+# Only use on read-only/nested serializers: the cache lives for one serializer  #
+# run and is never invalidated by save().                                       #
+# ----------------------------------------------------------------------------- #
+class RepresentationCacheMixin:
+
+    def to_representation(self, instance):
+        pk = getattr(instance, 'pk', None)
+        if pk is None:
+            return super().to_representation(instance)
+
+        cache = self.context.setdefault('_representation_cache', {})
+        key = (type(self), pk)
+        if key not in cache:
+            cache[key] = super().to_representation(instance)
+        return cache[key]
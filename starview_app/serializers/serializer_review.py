@@ -15,17 +15,125 @@
 # ----------------------------------------------------------------------------------------------------- #
 
 # Import tools:
+import logging
+from django.conf import settings
+from django.db import models
+from django.db.models import Prefetch, Value
+from django.db.models.functions import Concat, Trim
+from django.contrib.contenttypes.models import ContentType
+from django.utils.functional import SimpleLazyObject
 from rest_framework import serializers
 from ..models import Review
 from ..models import ReviewComment
 from ..models import ReviewPhoto
 from ..models import Vote
+from .serializer_mixins import RepresentationCacheMixin
+
+# Configure module logger
+logger = logging.getLogger(__name__)
+
+
+# Vote content types, resolved once per process (lazily, so importing this module never hits the DB):
+_REVIEW_CT = SimpleLazyObject(lambda: ContentType.objects.get_for_model(Review))
+_REVIEW_COMMENT_CT = SimpleLazyObject(lambda: ContentType.objects.get_for_model(ReviewComment))
+_VOTE_CONTENT_TYPES = {
+    Review: _REVIEW_CT,
+    ReviewComment: _REVIEW_COMMENT_CT,
+}
+
+
+
+# Votes prefetch trimmed to the columns read by vote counts/user_vote, plus the
+# generic FK columns Django needs to attach each vote to its object:
+def _votes_prefetch():
+    return Prefetch(
+        'votes',
+        queryset=Vote.objects.only('user', 'is_upvote', 'content_type', 'object_id')
+    )
+
+
+
+# Returns the requesting user's id (None for anonymous/no request), resolved once
+# per serializer context. Nested and list children share the root context, so
+# per-row fields skip re-walking request.user.is_authenticated:
+def get_auth_user_id(context):
+    if '_auth_user_id' not in context:
+        request = context.get('request')
+        context['_auth_user_id'] = request.user.id if request and request.user.is_authenticated else None
+    return context['_auth_user_id']
+
+
+
+# Returns the request's scheme + host (e.g. 'https://starview.app'), resolved once
+# per serializer context so photo URLs don't re-parse the request per field:
+def get_absolute_base_url(context):
+    if '_absolute_base_url' not in context:
+        request = context.get('request')
+        context['_absolute_base_url'] = request.build_absolute_uri('/')[:-1] if request else None
+    return context['_absolute_base_url']
+
+
+
+# ----------------------------------------------------------------------------- #
+# List serializer that resolves the requesting user's votes for a whole list    #
+# once. Votes come from the prefetched `votes` cache when present (no query);   #
+# objects without prefetched votes are resolved in a single query. Children     #
+# look up `self.parent.user_votes` ({object_id: is_upvote}) per row.            #
+# ----------------------------------------------------------------------------- #
+class UserVoteListSerializer(serializers.ListSerializer):
+
+    def to_representation(self, data):
+        items = data.all() if isinstance(data, models.manager.BaseManager) else data
+        if settings.DEBUG:
+            self._warn_if_not_prefetched(items)
+        self.user_votes = self._get_user_votes(items)
+        return super().to_representation(items)
+
+    def _warn_if_not_prefetched(self, items):
+        # Development-only guard: lists must be loaded through the child's
+        # prefetch_queryset(), otherwise every vote count becomes a per-row query.
+        # A warning rather than an assert, since a freshly created parent
+        # (e.g. a new favorite) legitimately serializes unprefetched reviews.
+        items = list(items)
+        if len(items) > 1 and 'votes' not in getattr(items[0], '_prefetched_objects_cache', {}):
+            logger.warning(
+                "%s list serialized without %s.prefetch_queryset(); vote fields will query per row",
+                self.child.Meta.model.__name__, type(self.child).__name__
+            )
+
+    def _get_user_votes(self, items):
+        user_id = get_auth_user_id(self.context)
+        if not user_id:
+            return {}
+
+        # Read the user's votes from prefetched votes where available, and only
+        # query for objects whose votes were not prefetched:
+        user_votes = {}
+        unprefetched_ids = []
+        for item in items:
+            prefetched = getattr(item, '_prefetched_objects_cache', {})
+            if 'votes' not in prefetched:
+                unprefetched_ids.append(item.id)
+                continue
+            for vote in prefetched['votes']:
+                if vote.user_id == user_id:
+                    user_votes[item.id] = vote.is_upvote
+                    break
+
+        if unprefetched_ids:
+            user_votes.update(Vote.objects.filter(
+                user_id=user_id,
+                content_type=_VOTE_CONTENT_TYPES[self.child.Meta.model],
+                object_id__in=unprefetched_ids
+            ).values_list('object_id', 'is_upvote'))
+
+        return user_votes
 
 
 
 class ReviewCommentSerializer(serializers.ModelSerializer):
     user = serializers.SerializerMethodField()
-    user_profile_picture = serializers.SerializerMethodField()
+    user_profile_picture = serializers.ReadOnlyField(source='user.userprofile.get_profile_picture_url')
     upvote_count = serializers.ReadOnlyField()
     downvote_count = serializers.ReadOnlyField()
     user_vote = serializers.SerializerMethodField()
@@ -36,66 +144,75 @@ class ReviewCommentSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = ReviewComment
-        fields = ['id', 'review', 'user', 'user_profile_picture', 'content',
-                  'created_at', 'upvote_count', 'downvote_count', 'user_vote', 'is_edited']
-        read_only_fields = ['id', 'user', 'review', 'created_at']
+        fields = ('id', 'review', 'user', 'user_profile_picture', 'content',
+                  'created_at', 'upvote_count', 'downvote_count', 'user_vote', 'is_edited')
+        read_only_fields = ('id', 'user', 'review', 'created_at')
+        list_serializer_class = UserVoteListSerializer
+
+    @classmethod
+    def prefetch_queryset(cls, queryset):
+        """
+        Apply the joins this serializer reads (author profile and votes) so
+        no field falls back to a per-comment query.
+        """
+        return queryset.select_related('user__userprofile').prefetch_related(_votes_prefetch())
 
     def get_user(self, obj):
         # Return full user information needed by frontend
+        # (relies on select_related('user__userprofile') in the viewset queryset)
+        user = obj.user
         return {
-            'username': obj.user.username,
-            'profile_picture_url': obj.user.userprofile.get_profile_picture_url
+            'username': user.username,
+            'profile_picture_url': user.userprofile.get_profile_picture_url
         }
 
-    def get_user_profile_picture(self, obj):
-        # Get the user's profile picture URL
-        return obj.user.userprofile.get_profile_picture_url
-
     def get_user_vote(self, obj):
-        request = self.context.get('request')
-        if request and request.user.is_authenticated:
-            # Use prefetched votes if available to avoid N+1 queries
-            if hasattr(obj, '_prefetched_objects_cache') and 'votes' in obj._prefetched_objects_cache:
-                # Filter prefetched votes for current user
-                user_votes = [v for v in obj.votes.all() if v.user_id == request.user.id]
-                if user_votes:
-                    return 'up' if user_votes[0].is_upvote else 'down'
-                return None
-            else:
-                # Fallback to model method if votes not prefetched
-                return obj.get_user_vote(request.user)
-        return None
-
-
-
-class ReviewPhotoSerializer(serializers.ModelSerializer):
+        user_id = get_auth_user_id(self.context)
+        if not user_id:
+            return None
+
+        # Use votes resolved once for the whole list if available
+        user_votes = getattr(self.parent, 'user_votes', None)
+        if user_votes is not None:
+            is_upvote = user_votes.get(obj.id)
+            return None if is_upvote is None else ('up' if is_upvote else 'down')
+
+        # Votes are prefetched by prefetch_queryset(), so .all() reads the cached list
+        # (generator stops at the first match without building a filtered list)
+        vote = next((v for v in obj.votes.all() if v.user_id == user_id), None)
+        return None if vote is None else ('up' if vote.is_upvote else 'down')
+
+
+
+class ReviewPhotoSerializer(RepresentationCacheMixin, serializers.ModelSerializer):
     image_url = serializers.SerializerMethodField()
     thumbnail_url = serializers.SerializerMethodField()
 
     class Meta:
         model = ReviewPhoto
-        fields = ['id', 'image', 'thumbnail', 'caption', 'order',
-                  'image_url', 'thumbnail_url', 'created_at']
-        read_only_fields = ['id', 'thumbnail', 'created_at']
+        fields = ('id', 'image', 'thumbnail', 'caption', 'order',
+                  'image_url', 'thumbnail_url', 'created_at')
+        read_only_fields = ('id', 'thumbnail', 'created_at')
 
     def get_image_url(self, obj):
-        request = self.context.get('request')
-        if obj.image and request:
-            return request.build_absolute_uri(obj.image.url)
-        return obj.image_url if obj.image else None
+        return self._absolute_url(obj.image.url) if obj.image else None
 
     def get_thumbnail_url(self, obj):
-        request = self.context.get('request')
-        if obj.thumbnail and request:
-            return request.build_absolute_uri(obj.thumbnail.url)
-        return obj.thumbnail_url if obj.thumbnail else None
+        return self._absolute_url(obj.thumbnail.url) if obj.thumbnail else None
+
+    def _absolute_url(self, url):
+        # Storage URLs are either site-relative (local media) or already absolute (S3/CDN)
+        base = get_absolute_base_url(self.context)
+        if base and url.startswith('/') and not url.startswith('//'):
+            return base + url
+        return url
 
 
 
 class ReviewSerializer(serializers.ModelSerializer):
     user = serializers.ReadOnlyField(source='user.username')
     user_full_name = serializers.SerializerMethodField()
-    user_profile_picture = serializers.SerializerMethodField()
+    user_profile_picture = serializers.ReadOnlyField(source='user.userprofile.get_profile_picture_url')
     vote_count = serializers.ReadOnlyField()
     upvote_count = serializers.ReadOnlyField()
     downvote_count = serializers.ReadOnlyField()
@@ -108,38 +225,50 @@ class ReviewSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Review
-        fields = ['id', 'location', 'user', 'user_full_name', 'user_profile_picture',
+        fields = ('id', 'location', 'user', 'user_full_name', 'user_profile_picture',
                  'rating', 'comment', 'created_at', 'updated_at',
-                  'vote_count', 'upvote_count', 'downvote_count', 'user_vote', 'photos', 'is_edited']
-        read_only_fields = ['id', 'user', 'location', 'created_at', 'updated_at']
+                  'vote_count', 'upvote_count', 'downvote_count', 'user_vote', 'photos', 'is_edited')
+        read_only_fields = ('id', 'user', 'location', 'created_at', 'updated_at')
+        list_serializer_class = UserVoteListSerializer
+
+    @classmethod
+    def prefetch_queryset(cls, queryset):
+        """
+        Apply the joins this serializer reads (author profile, photos and
+        votes) so no field falls back to a per-review query. Views serializing
+        reviews should always build their queryset through this method.
+        """
+        return queryset.select_related('user__userprofile').prefetch_related(
+            # Ordered in SQL (backed by the (review, order) index) and trimmed to serialized columns
+            Prefetch(
+                'photos',
+                queryset=ReviewPhoto.objects.order_by('order', 'created_at').only(
+                    'id', 'review_id', 'image', 'thumbnail', 'caption', 'order', 'created_at'
+                )
+            ),
+            _votes_prefetch(),
+        ).annotate(
+            user_full_name_annotated=Trim(Concat('user__first_name', Value(' '), 'user__last_name'))
+        )
 
     def get_user_full_name(self, obj):
+        # Use annotation if available (from prefetch_queryset), otherwise compute
+        if hasattr(obj, 'user_full_name_annotated'):
+            return obj.user_full_name_annotated
         return f"{obj.user.first_name} {obj.user.last_name}".strip()
 
-    def get_user_profile_picture(self, obj):
-        return obj.user.userprofile.get_profile_picture_url
-
     def get_user_vote(self, obj):
-        request = self.context.get('request')
-        if request and request.user.is_authenticated:
-            # Use prefetched votes if available to avoid N+1 queries
-            if hasattr(obj, '_prefetched_objects_cache') and 'votes' in obj._prefetched_objects_cache:
-                # Filter prefetched votes for current user
-                user_votes = [v for v in obj.votes.all() if v.user_id == request.user.id]
-                if user_votes:
-                    return 'up' if user_votes[0].is_upvote else 'down'
-            else:
-                # Fallback to querying if votes not prefetched
-                from django.contrib.contenttypes.models import ContentType
-                content_type = ContentType.objects.get_for_model(obj)
-
-                vote = Vote.objects.filter(
-                    user=request.user,
-                    content_type=content_type,
-                    object_id=obj.id
-                ).first()
-
-                # Convert boolean to string representation
-                if vote is not None:  # Check if vote exists
-                    return 'up' if vote.is_upvote else 'down'
-        return None  # Return None if no vote exists
+        user_id = get_auth_user_id(self.context)
+        if not user_id:
+            return None
+
+        # Use votes resolved once for the whole list if available
+        user_votes = getattr(self.parent, 'user_votes', None)
+        if user_votes is not None:
+            is_upvote = user_votes.get(obj.id)
+            return None if is_upvote is None else ('up' if is_upvote else 'down')
+
+        # Votes are prefetched by prefetch_queryset(), so .all() reads the cached list
+        # (generator stops at the first match without building a filtered list)
+        vote = next((v for v in obj.votes.all() if v.user_id == user_id), None)
+        return None if vote is None else ('up' if vote.is_upvote else 'down')
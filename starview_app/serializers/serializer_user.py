@@ -15,20 +15,66 @@
 
 # Import tools:
 from rest_framework import serializers
+from django.conf import settings
 from django.contrib.auth.models import User
+from django.db import models
+from django.db.models import OuterRef
 from starview_app.models.model_user_profile import UserProfile
+from starview_app.models import Review, FavoriteLocation, Follow, Vote
+from starview_app.utils.queries import count_subquery
+from .serializer_review import get_auth_user_id
+from .serializer_mixins import RepresentationCacheMixin
 
 
 
-class UserProfileSerializer(serializers.ModelSerializer):
+# Ids among `user_ids` that `user_id` follows, resolved in one IN query:
+def _get_followed_ids(user_id, user_ids):
+    if not user_id or not user_ids:
+        return set()
+
+    return set(Follow.objects.filter(
+        follower_id=user_id,
+        following_id__in=user_ids
+    ).values_list('following_id', flat=True))
+
+
+
+# ----------------------------------------------------------------------------- #
+# List serializer that resolves which listed users the requester follows in one #
+# IN query. Children look up `self.parent.followed_ids` instead of running an   #
+# EXISTS query per user.                                                        #
+# ----------------------------------------------------------------------------- #
+class FollowedUserListSerializer(serializers.ListSerializer):
+
+    def to_representation(self, data):
+        items = data.all() if isinstance(data, models.manager.BaseManager) else data
+        self.followed_ids = _get_followed_ids(get_auth_user_id(self.context), [user.id for user in items])
+        return super().to_representation(items)
+
+
+
+# ----------------------------------------------------------------------------- #
+# Resolves `user.userprofile` once per serialized user and stores it on the     #
+# instance as `_profile`. Profile-backed fields use source='_profile.<attr>',   #
+# a plain attribute read instead of a reverse one-to-one descriptor per field.  #
+# ----------------------------------------------------------------------------- #
+class ProfileCacheMixin:
+
+    def to_representation(self, instance):
+        instance._profile = instance.userprofile
+        return super().to_representation(instance)
+
+
+
+class UserProfileSerializer(RepresentationCacheMixin, serializers.ModelSerializer):
     user = serializers.ReadOnlyField(source='user.username')
     profile_picture_url = serializers.ReadOnlyField(source='get_profile_picture_url')
 
     class Meta:
         model = UserProfile
-        fields = ['id', 'user', 'profile_picture', 'profile_picture_url',
-                  'created_at', 'updated_at']
-        read_only_fields = ['id', 'user', 'created_at', 'updated_at']
+        fields = ('id', 'user', 'profile_picture', 'profile_picture_url',
+                  'created_at', 'updated_at')
+        read_only_fields = ('id', 'user', 'created_at', 'updated_at')
 
 
 
@@ -37,8 +83,8 @@ class UserSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = User
-        fields = ['id', 'username', 'email', 'first_name', 'last_name', 'date_joined', 'profile']
-        read_only_fields = ['id', 'username', 'date_joined']
+        fields = ('id', 'username', 'email', 'first_name', 'last_name', 'date_joined', 'profile')
+        read_only_fields = ('id', 'username', 'date_joined')
 
 
 # ----------------------------------------------------------------------------- #
@@ -47,102 +93,165 @@ class UserSerializer(serializers.ModelSerializer):
 # Returns only public information about a user. NO email, NO sensitive data.    #
 # Used by: GET /api/users/{username}/                                           #
 # ----------------------------------------------------------------------------- #
-class PublicUserSerializer(serializers.ModelSerializer):
-    profile_picture_url = serializers.SerializerMethodField()
-    bio = serializers.CharField(source='userprofile.bio', read_only=True)
-    is_verified = serializers.BooleanField(source='userprofile.is_verified', read_only=True)
+class PublicUserSerializer(ProfileCacheMixin, serializers.ModelSerializer):
+    profile_picture_url = serializers.ReadOnlyField(source='_profile.get_profile_picture_url')
+    bio = serializers.CharField(source='_profile.bio', read_only=True)
+    is_verified = serializers.BooleanField(source='_profile.is_verified', read_only=True)
     stats = serializers.SerializerMethodField()
     is_following = serializers.SerializerMethodField()
-    pinned_badge_ids = serializers.ListField(source='userprofile.pinned_badge_ids', read_only=True)
+    pinned_badge_ids = serializers.ListField(source='_profile.pinned_badge_ids', read_only=True)
 
     class Meta:
         model = User
-        fields = ['id', 'username', 'first_name', 'last_name', 'date_joined',
+        fields = ('id', 'username', 'first_name', 'last_name', 'date_joined',
                   'profile_picture_url', 'bio', 'is_verified', 'stats', 'is_following',
-                  'pinned_badge_ids']
-        read_only_fields = ['id', 'username', 'first_name', 'last_name', 'date_joined']
+                  'pinned_badge_ids')
+        read_only_fields = ('id', 'username', 'first_name', 'last_name', 'date_joined')
+        list_serializer_class = FollowedUserListSerializer
+
+    @classmethod
+    def prefetch_queryset(cls, queryset):
+        """
+        Join the profile and annotate every public stat in the same SELECT, so
+        serializing a page of users costs one query instead of six per user.
+        """
+        return queryset.select_related('userprofile').annotate(**cls._stat_annotations())
 
-    def get_profile_picture_url(self, obj):
-        """Get user's profile picture URL"""
-        return obj.userprofile.get_profile_picture_url
+    @staticmethod
+    def _stat_annotations():
+        """Correlated COUNT subqueries for each public stat, keyed by annotation name."""
+        return dict(
+            review_count_annotated=count_subquery(
+                Review.objects.filter(user=OuterRef('pk'))
+            ),
+            favorite_count_annotated=count_subquery(
+                FavoriteLocation.objects.filter(user=OuterRef('pk'))
+            ),
+            # Upvotes on the user's reviews (GenericRelation join adds the content type)
+            helpful_votes_annotated=count_subquery(
+                Vote.objects.filter(review__user=OuterRef('pk'), is_upvote=True)
+            ),
+            follower_count_annotated=count_subquery(
+                Follow.objects.filter(following=OuterRef('pk'))
+            ),
+            following_count_annotated=count_subquery(
+                Follow.objects.filter(follower=OuterRef('pk'))
+            ),
+        )
 
     def get_is_following(self, obj):
         """Check if the requesting user is following this user"""
-        request = self.context.get('request')
+        user_id = get_auth_user_id(self.context)
 
-        # If no request context or user is not authenticated, return None
-        if not request or not request.user.is_authenticated:
+        # Anonymous request or own profile: nothing to check (integer compare, no ORM)
+        if not user_id or user_id == obj.id:
             return None
 
-        # Don't check for own profile
-        if request.user == obj:
-            return None
+        # Use follows resolved once for the whole list if available
+        followed_ids = getattr(self.parent, 'followed_ids', None)
+        if followed_ids is not None:
+            return obj.id in followed_ids
 
-        from starview_app.models import Follow
         return Follow.objects.filter(
-            follower=request.user,
+            follower_id=user_id,
             following=obj
         ).exists()
 
     def get_stats(self, obj):
         """Get user's public statistics"""
-        from starview_app.models import Review, FavoriteLocation, Follow
-        from django.db.models import Count, Sum
-        from django.contrib.contenttypes.models import ContentType
-
-        # Get review count and locations reviewed count
-        review_count = Review.objects.filter(user=obj).count()
-        locations_reviewed = Review.objects.filter(user=obj).values('location').distinct().count()
-
-        # Get favorite count
-        favorite_count = FavoriteLocation.objects.filter(user=obj).count()
-
-        # Get helpful votes received (upvotes on user's reviews)
-        from starview_app.models import Vote
-        review_ct = ContentType.objects.get_for_model(Review)
-        user_review_ids = Review.objects.filter(user=obj).values_list('id', flat=True)
-        helpful_votes = Vote.objects.filter(
-            content_type=review_ct,
-            object_id__in=user_review_ids,
-            is_upvote=True  # Upvotes only
-        ).count()
-
-        # Get follower/following counts
-        follower_count = Follow.objects.filter(following=obj).count()
-        following_count = Follow.objects.filter(follower=obj).count()
+        # Use annotations from prefetch_queryset if available, otherwise fetch
+        # them as a plain dict in one query (no User instance is built)
+        if hasattr(obj, 'review_count_annotated'):
+            counts = vars(obj)  # Annotations are plain instance attributes
+        else:
+            annotations = self._stat_annotations()
+            counts = User.objects.filter(pk=obj.pk).annotate(**annotations).values(*annotations).get()
 
         return {
-            'review_count': review_count,
-            'locations_reviewed': locations_reviewed,
-            'favorite_count': favorite_count,
-            'helpful_votes_received': helpful_votes,
-            'follower_count': follower_count,
-            'following_count': following_count
+            'review_count': counts['review_count_annotated'],
+            # One review per user per location, so every review is a distinct location
+            'locations_reviewed': counts['review_count_annotated'],
+            'favorite_count': counts['favorite_count_annotated'],
+            'helpful_votes_received': counts['helpful_votes_annotated'],
+            'follower_count': counts['follower_count_annotated'],
+            'following_count': counts['following_count_annotated']
         }
 
 
+# ----------------------------------------------------------------------------- #
+# Flat projection of PublicUserSerializer for paginated user lists.             #
+#                                                                               #
+# public_user_values() turns a user queryset into a .values() queryset (stats   #
+# annotated, profile columns joined) that can be paginated directly, and        #
+# serialize_public_user_rows() shapes a page of those rows exactly like         #
+# PublicUserSerializer(many=True) - without building User/UserProfile           #
+# instances or dispatching DRF fields per row.                                  #
+# Used by: GET /api/users/{username}/followers/ and /following/                 #
+# ----------------------------------------------------------------------------- #
+_PUBLIC_USER_VALUES = (
+    'id', 'username', 'first_name', 'last_name', 'date_joined',
+    'userprofile__profile_picture', 'userprofile__bio', 'userprofile__is_verified',
+    'userprofile__pinned_badge_ids',
+)
+_date_joined_field = serializers.DateTimeField()
+
+
+def public_user_values(queryset):
+    annotations = PublicUserSerializer._stat_annotations()
+    return queryset.annotate(**annotations).values(*_PUBLIC_USER_VALUES, *annotations)
+
+
+def serialize_public_user_rows(rows, context):
+    user_id = get_auth_user_id(context)
+    followed_ids = _get_followed_ids(user_id, [row['id'] for row in rows])
+    picture_storage = UserProfile._meta.get_field('profile_picture').storage
+
+    return [
+        {
+            'id': row['id'],
+            'username': row['username'],
+            'first_name': row['first_name'],
+            'last_name': row['last_name'],
+            'date_joined': _date_joined_field.to_representation(row['date_joined']),
+            'profile_picture_url': (
+                picture_storage.url(row['userprofile__profile_picture'])
+                if row['userprofile__profile_picture'] else settings.DEFAULT_PROFILE_PICTURE
+            ),
+            'bio': row['userprofile__bio'],
+            'is_verified': row['userprofile__is_verified'],
+            'stats': {
+                'review_count': row['review_count_annotated'],
+                'locations_reviewed': row['review_count_annotated'],
+                'favorite_count': row['favorite_count_annotated'],
+                'helpful_votes_received': row['helpful_votes_annotated'],
+                'follower_count': row['follower_count_annotated'],
+                'following_count': row['following_count_annotated'],
+            },
+            'is_following': None if not user_id or user_id == row['id'] else row['id'] in followed_ids,
+            'pinned_badge_ids': row['userprofile__pinned_badge_ids'],
+        }
+        for row in rows
+    ]
+
+
 # ----------------------------------------------------------------------------- #
 # Private Profile Serializer - Used for authenticated user's own profile        #
 #                                                                               #
 # Returns full profile data including email and private fields.                 #
 # Used by: GET /api/users/me/                                                   #
 # ----------------------------------------------------------------------------- #
-class PrivateProfileSerializer(serializers.ModelSerializer):
-    profile_picture_url = serializers.SerializerMethodField()
-    bio = serializers.CharField(source='userprofile.bio', read_only=True)
-    is_verified = serializers.BooleanField(source='userprofile.is_verified', read_only=True)
+class PrivateProfileSerializer(ProfileCacheMixin, serializers.ModelSerializer):
+    profile_picture_url = serializers.ReadOnlyField(source='_profile.get_profile_picture_url')
+    bio = serializers.CharField(source='_profile.bio', read_only=True)
+    is_verified = serializers.BooleanField(source='_profile.is_verified', read_only=True)
     has_usable_password = serializers.BooleanField(read_only=True)
-    pinned_badge_ids = serializers.ListField(source='userprofile.pinned_badge_ids', read_only=True)
-    unit_preference = serializers.CharField(source='userprofile.unit_preference', read_only=True)
-    language_preference = serializers.CharField(source='userprofile.language_preference', read_only=True)
+    pinned_badge_ids = serializers.ListField(source='_profile.pinned_badge_ids', read_only=True)
+    unit_preference = serializers.CharField(source='_profile.unit_preference', read_only=True)
+    language_preference = serializers.CharField(source='_profile.language_preference', read_only=True)
 
     class Meta:
         model = User
-        fields = ['id', 'username', 'email', 'first_name', 'last_name', 'date_joined',
+        fields = ('id', 'username', 'email', 'first_name', 'last_name', 'date_joined',
                   'profile_picture_url', 'bio', 'is_verified', 'has_usable_password',
-                  'pinned_badge_ids', 'unit_preference', 'language_preference']
-        read_only_fields = ['id', 'username', 'date_joined', 'has_usable_password']
-
-    def get_profile_picture_url(self, obj):
-        """Get user's profile picture URL"""
-        return obj.userprofile.get_profile_picture_url
+                  'pinned_badge_ids', 'unit_preference', 'language_preference')
+        read_only_fields = ('id', 'username', 'date_joined', 'has_usable_password')
@@ -28,15 +28,75 @@
 
 # Import tools:
 import math
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from io import BytesIO
 
+import numpy as np
 import requests
 from PIL import Image
 from django.conf import settings
+from django.core.cache import cache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from starview_app.utils.cache import (
+    geocode_cache_key, elevation_cache_key, terrain_tile_cache_key,
+    GEOCODE_CACHE_TIMEOUT, ELEVATION_CACHE_TIMEOUT, TERRAIN_TILE_CACHE_TIMEOUT
+)
+
+
+# ----------------------------------------------------------------------------- #
+# Shared HTTP session for all Mapbox requests.                                  #
+#                                                                               #
+# urllib3 keeps connections to api.mapbox.com alive in the session's pool, so   #
+# the geocoding and terrain calls (and consecutive location saves in the same   #
+# process) reuse one TLS connection instead of handshaking on every request.    #
+# Transient failures (429/5xx) are retried twice with a short backoff.          #
+# ----------------------------------------------------------------------------- #
+_MAPBOX_SESSION = requests.Session()
+_MAPBOX_SESSION.mount('https://', HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=20,
+    max_retries=Retry(total=2, backoff_factor=0.2, status_forcelist=[429, 500, 502, 503, 504]),
+))
+
+# Concurrent Mapbox requests per batch enrichment (below the session's pool size)
+_BATCH_WORKERS = 8
+
+# Rows per UPDATE in bulk writes (bulk_update emits one CASE WHEN branch per row)
+_BULK_UPDATE_BATCH_SIZE = 500
+
+# Mapbox place types mapped to Location address fields, in precedence order
+# (a feature tagged with several types fills the first matching field only)
+_ADDRESS_COMPONENTS = (
+    ('country', 'country'),
+    ('region', 'administrative_area'),
+    ('place', 'locality'),
+)
+
+# Mapbox endpoint templates (the token is filled in per call so settings overrides apply)
+_GEOCODE_URL = (
+    'https://api.mapbox.com/geocoding/v5/mapbox.places/{lon},{lat}.json'
+    '?access_token={token}&types=place,region,country'
+)
+_TERRAIN_TILE_URL = (
+    'https://api.mapbox.com/v4/mapbox.mapbox-terrain-dem-v1/{zoom}/{x}/{y}.pngraw'
+    '?access_token={token}'
+)
+_TILEQUERY_CONTOUR_URL = (
+    'https://api.mapbox.com/v4/mapbox.mapbox-terrain-v2/tilequery/{lon},{lat}.json'
+    '?layers=contour&limit=50&access_token={token}'
+)
 
 
 class LocationService:
 
+    # Location fields written by each enrichment step (save(update_fields=...)):
+    ADDRESS_FIELDS = ['formatted_address', 'administrative_area', 'locality', 'country']
+    ELEVATION_FIELDS = ['elevation']
+    BORTLE_FIELDS = ['bortle_class', 'bortle_sqm']
 
 
     # ------------------------------------------------------------------------------------------------- #
@@ -56,7 +116,7 @@ class LocationService:
     @staticmethod
     def _make_mapbox_request(url):
         try:
-            response = requests.get(url, timeout=10)
+            response = _MAPBOX_SESSION.get(url, timeout=10)
             response.raise_for_status()
             return response.json()
 
@@ -73,36 +133,110 @@ class LocationService:
             return None
 
 
+    # ----------------------------------------------------------------------------- #
+    # Checks that a location has usable coordinates before calling Mapbox.          #
+    #                                                                               #
+    # Missing or out-of-range coordinates (and Null Island, 0/0, the usual sign of  #
+    # an unset point) would only produce failed or meaningless API calls.           #
+    #                                                                               #
+    # Args:   location (Location): Location to check                                #
+    # Returns: True if latitude/longitude are set and within range                  #
+    # ----------------------------------------------------------------------------- #
+    @staticmethod
+    def _has_valid_coordinates(location):
+        lat, lon = location.latitude, location.longitude
+        if lat is None or lon is None:
+            return False
 
-    # ------------------------------------------------------------------------------------------------- #
-    #                                                                                                   #
-    #                                    SERVICE METHODS                                                #
-    #                                                                                                   #
-    # ------------------------------------------------------------------------------------------------- #
+        lat, lon = float(lat), float(lon)
+        if lat == 0 and lon == 0:
+            return False
+
+        return -90 <= lat <= 90 and -180 <= lon <= 180
+
+
+    # ----------------------------------------------------------------------------- #
+    # Reads/writes enrichment results in the shared cache.                          #
+    #                                                                               #
+    # Cache errors (e.g. Redis unavailable) are treated as a miss so enrichment     #
+    # falls through to the Mapbox API instead of failing.                           #
+    # ----------------------------------------------------------------------------- #
+    @staticmethod
+    def _cache_get(key):
+        try:
+            return cache.get(key)
+        except Exception:
+            # Warning: Cache read failed for {key}, falling back to Mapbox
+            return None
 
-    # Updates address fields using Mapbox reverse geocoding:
     @staticmethod
-    def update_address_from_coordinates(location):
-        mapbox_token = settings.MAPBOX_TOKEN
+    def _cache_set(key, value, timeout):
+        try:
+            cache.set(key, value, timeout)
+        except Exception:
+            # Warning: Cache write failed for {key}
+            pass
 
-        url = (f"https://api.mapbox.com/geocoding/v5/mapbox.places/"
-               f"{location.longitude},{location.latitude}.json"
-               f"?access_token={mapbox_token}&types=place,region,country")
+
+    # ----------------------------------------------------------------------------- #
+    # Fetches reverse geocoding data for a location's coordinates.                  #
+    #                                                                               #
+    # HTTP only (no database access), so it can run on a worker thread.             #
+    #                                                                               #
+    # Responses are cached for 48 hours on a ~100m grid (geocode_cache_key), so     #
+    # nearby locations reuse one lookup. Only place_type/text of each feature are   #
+    # kept - the rest of the payload is never read.                                 #
+    #                                                                               #
+    # Args:   location (Location): Location with latitude/longitude set             #
+    # Returns: Mapbox geocoding JSON if successful, None otherwise                  #
+    # ----------------------------------------------------------------------------- #
+    @staticmethod
+    def _fetch_address_data(location):
+        if not LocationService._has_valid_coordinates(location):
+            return None
+
+        cache_key = geocode_cache_key(location.latitude, location.longitude)
+        cached = LocationService._cache_get(cache_key)
+        if cached is not None:
+            return cached
+
+        url = _GEOCODE_URL.format(
+            lon=location.longitude, lat=location.latitude, token=settings.MAPBOX_TOKEN
+        )
 
         data = LocationService._make_mapbox_request(url)
+        if not data or not data.get('features'):
+            return data
+
+        data = {'features': [
+            {'place_type': feature['place_type'], 'text': feature['text']}
+            for feature in data['features']
+            if 'place_type' in feature
+        ]}
+        LocationService._cache_set(cache_key, data, GEOCODE_CACHE_TIMEOUT)
+        return data
+
+
+    # ----------------------------------------------------------------------------- #
+    # Copies address components from geocoding data onto a location (no save).      #
+    #                                                                               #
+    # Args:   location (Location): Location to update                               #
+    #         data (dict): Mapbox geocoding JSON (or None)                          #
+    # Returns: True if address fields were set, False if there was no address data  #
+    # ----------------------------------------------------------------------------- #
+    @staticmethod
+    def _apply_address_data(location, data):
         if not data or not data.get('features'):
             # Warning: No address data found for location: {location.name}
             return False
 
         # Process the response to extract address components
         for feature in data['features']:
-            if 'place_type' in feature:
-                if 'country' in feature['place_type']:
-                    location.country = feature['text']
-                elif 'region' in feature['place_type']:
-                    location.administrative_area = feature['text']
-                elif 'place' in feature['place_type']:
-                    location.locality = feature['text']
+            place_types = feature.get('place_type', ())
+            for place_type, field in _ADDRESS_COMPONENTS:
+                if place_type in place_types:
+                    setattr(location, field, feature['text'])
+                    break
 
         # Create formatted address
         address_parts = [
@@ -111,18 +245,111 @@ class LocationService:
         ]
 
         location.formatted_address = ", ".join(address_parts)
-        location.save(update_fields=[
-            'formatted_address', 'administrative_area', 'locality', 'country'
-        ])
-
-        # Info: Updated address for {location.name}: {location.formatted_address}
         return True
 
 
-    # Updates elevation using Mapbox Terrain-DEM API (0.1m precision):
+    # ----------------------------------------------------------------------------- #
+    # Fetches the raw PNG bytes of a Mapbox Terrain-DEM tile.                       #
+    #                                                                               #
+    # Tiles are cached in Redis for 7 days (shared across web and Celery workers),  #
+    # so locations that fall in the same zoom-14 tile (~2.4km) skip the download.   #
+    # Failed requests raise and are never cached.                                   #
+    #                                                                               #
+    # Args:   zoom, tile_x, tile_y (int): Slippy-map tile coordinates               #
+    # Returns: bytes: PNG tile data                                                 #
+    # Raises:  requests.exceptions.RequestException if the tile can't be fetched    #
+    # ----------------------------------------------------------------------------- #
+    @staticmethod
+    def _fetch_terrain_tile(zoom, tile_x, tile_y):
+        cache_key = terrain_tile_cache_key(zoom, tile_x, tile_y)
+        tile = LocationService._cache_get(cache_key)
+        if tile is not None:
+            return tile
+
+        # Fetch the Terrain-DEM tile (actively maintained, replaces deprecated Terrain-RGB)
+        url = _TERRAIN_TILE_URL.format(zoom=zoom, x=tile_x, y=tile_y, token=settings.MAPBOX_TOKEN)
+
+        response = _MAPBOX_SESSION.get(url, timeout=10)
+        response.raise_for_status()
+
+        LocationService._cache_set(cache_key, response.content, TERRAIN_TILE_CACHE_TIMEOUT)
+        return response.content
+
+
+    # ----------------------------------------------------------------------------- #
+    # Returns a Terrain-DEM tile decoded to an RGB pixel array.                     #
+    #                                                                               #
+    # The most recent decoded tiles are kept in-process (LRU), so repeated lookups  #
+    # in the same tile read a pixel from memory instead of re-inflating the PNG.    #
+    # Fetch and decode errors raise and are never cached.                           #
+    #                                                                               #
+    # Args:   zoom, tile_x, tile_y (int): Slippy-map tile coordinates               #
+    # Returns: numpy.ndarray: uint8 array of shape (256, 256, 3), indexed [y, x]    #
+    # ----------------------------------------------------------------------------- #
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def _load_terrain_tile(zoom, tile_x, tile_y):
+        tile = LocationService._fetch_terrain_tile(zoom, tile_x, tile_y)
+        img = Image.open(BytesIO(tile))
+
+        # Terrain-DEM pngraw tiles are RGB or RGBA: wrap the decoded buffer directly
+        # (dropping alpha is a view) instead of copying it through convert('RGB')
+        if img.mode == 'RGB':
+            return np.asarray(img)
+        if img.mode == 'RGBA':
+            return np.asarray(img)[:, :, :3]
+        return np.asarray(img.convert('RGB'))
+
+
+    # ----------------------------------------------------------------------------- #
+    # Fetches approximate elevation from the Mapbox Tilequery API (terrain-v2).     #
+    #                                                                               #
+    # Returns the highest contour band containing the point: a small JSON response  #
+    # instead of a tile image, but only 10m resolution. Used for precision=         #
+    # 'standard' lookups; Terrain-DEM tiles remain the default (0.1m).              #
+    #                                                                               #
+    # Args:   location (Location): Location with latitude/longitude set             #
+    # Returns: Elevation in meters (10m contour) if successful, None otherwise      #
+    # ----------------------------------------------------------------------------- #
     @staticmethod
-    def update_elevation_from_mapbox(location):
-        mapbox_token = settings.MAPBOX_TOKEN
+    def _fetch_contour_elevation(location):
+        if not LocationService._has_valid_coordinates(location):
+            return None
+
+        url = _TILEQUERY_CONTOUR_URL.format(
+            lon=location.longitude, lat=location.latitude, token=settings.MAPBOX_TOKEN
+        )
+
+        data = LocationService._make_mapbox_request(url)
+        elevations = [
+            feature['properties']['ele']
+            for feature in (data or {}).get('features', [])
+            if feature.get('properties', {}).get('ele') is not None
+        ]
+        if not elevations:
+            # Warning: No contour data found for location: {location.name}
+            return None
+
+        return float(max(elevations))
+
+
+    # ----------------------------------------------------------------------------- #
+    # Fetches elevation for a location from a Mapbox Terrain-DEM tile.              #
+    #                                                                               #
+    # HTTP and pixel decoding only (no database access), so it can run on a worker  #
+    # thread.                                                                       #
+    #                                                                               #
+    # Results are cached for 30 days per tile pixel (elevation_cache_key), so       #
+    # locations sampling the same pixel skip the tile download entirely.            #
+    #                                                                               #
+    # Args:   location (Location): Location with latitude/longitude set             #
+    # Returns: Elevation in meters (0.1m precision) if successful, None otherwise   #
+    # ----------------------------------------------------------------------------- #
+    @staticmethod
+    def _fetch_elevation(location):
+        if not LocationService._has_valid_coordinates(location):
+            return None
+
         lat = float(location.latitude)
         lon = float(location.longitude)
 
@@ -147,41 +374,190 @@ class LocationService:
         pixel_x = max(0, min(255, pixel_x))
         pixel_y = max(0, min(255, pixel_y))
 
-        # Fetch the Terrain-DEM tile (actively maintained, replaces deprecated Terrain-RGB)
-        url = (f"https://api.mapbox.com/v4/mapbox.mapbox-terrain-dem-v1/{zoom}/{tile_x}/{tile_y}.pngraw"
-               f"?access_token={mapbox_token}")
+        cache_key = elevation_cache_key(zoom, tile_x, tile_y, pixel_x, pixel_y)
+        cached = LocationService._cache_get(cache_key)
+        if cached is not None:
+            return cached
 
         try:
-            response = requests.get(url, timeout=10)
-            response.raise_for_status()
+            pixels = LocationService._load_terrain_tile(zoom, tile_x, tile_y)
         except requests.exceptions.RequestException:
             # Warning: Failed to fetch elevation tile for location: {location.name}
-            return False
+            return None
+        except Exception:
+            # Warning: Failed to decode elevation tile for location: {location.name}
+            return None
 
         # Decode elevation from RGB values
         # Formula: elevation = -10000 + ((R * 256² + G * 256 + B) * 0.1)
         try:
-            img = Image.open(BytesIO(response.content))
-            r, g, b = img.getpixel((pixel_x, pixel_y))[:3]
+            r, g, b = map(int, pixels[pixel_y, pixel_x])
             elevation = -10000 + ((r * 256 * 256 + g * 256 + b) * 0.1)
         except Exception:
             # Warning: Failed to decode elevation for location: {location.name}
+            return None
+
+        elevation = round(elevation, 1)
+        LocationService._cache_set(cache_key, elevation, ELEVATION_CACHE_TIMEOUT)
+        return elevation
+
+
+    # ----------------------------------------------------------------------------- #
+    # Fetches Terrain-DEM elevations for many locations at once.                    #
+    #                                                                               #
+    # Tile/pixel coordinates for every location are computed in one vectorized      #
+    # NumPy pass (same formulas as _fetch_elevation) and locations are grouped by   #
+    # tile, so each unique tile is fetched and decoded once (tiles in parallel on   #
+    # a thread pool) and all of its locations are read with a single fancy index.   #
+    # No database access.                                                           #
+    #                                                                               #
+    # Args:   locations (list[Location]): Locations to look up                      #
+    # Returns: list: Elevation per location (None on failure/missing coordinates)   #
+    # ----------------------------------------------------------------------------- #
+    @staticmethod
+    def _fetch_elevations(locations):
+        locations = list(locations)
+        results = [None] * len(locations)
+
+        indexes = [
+            index for index, location in enumerate(locations)
+            if LocationService._has_valid_coordinates(location)
+        ]
+        if not indexes:
+            return results
+
+        lats = np.fromiter((float(locations[i].latitude) for i in indexes), dtype=np.float64, count=len(indexes))
+        lons = np.fromiter((float(locations[i].longitude) for i in indexes), dtype=np.float64, count=len(indexes))
+
+        zoom = 14
+        n = 2 ** zoom
+
+        # Tile coordinates (astype truncates toward zero, like int())
+        tile_x = ((lons + 180) / 360 * n).astype(np.int64)
+        tile_y = ((1 - np.arcsinh(np.tan(np.radians(lats))) / np.pi) / 2 * n).astype(np.int64)
+
+        # Pixel position within each 256x256 tile
+        tile_lon_min = tile_x / n * 360 - 180
+        tile_lat_max = np.degrees(np.arctan(np.sinh(np.pi * (1 - 2 * tile_y / n))))
+        tile_lon_max = (tile_x + 1) / n * 360 - 180
+        tile_lat_min = np.degrees(np.arctan(np.sinh(np.pi * (1 - 2 * (tile_y + 1) / n))))
+
+        pixel_x = ((lons - tile_lon_min) / (tile_lon_max - tile_lon_min) * 256).astype(np.int64)
+        pixel_y = ((tile_lat_max - lats) / (tile_lat_max - tile_lat_min) * 256).astype(np.int64)
+        pixel_x = np.clip(pixel_x, 0, 255)
+        pixel_y = np.clip(pixel_y, 0, 255)
+
+        # Group positions (into the arrays above) by tile
+        tiles = defaultdict(list)
+        for position, tile in enumerate(zip(tile_x.tolist(), tile_y.tolist())):
+            tiles[tile].append(position)
+
+        # Fetch and decode the tiles in parallel (Pillow releases the GIL while inflating)
+        with ThreadPoolExecutor(max_workers=min(_BATCH_WORKERS, len(tiles))) as executor:
+            tile_futures = {
+                tile: executor.submit(LocationService._load_terrain_tile, zoom, *tile)
+                for tile in tiles
+            }
+
+        for (x, y), members in tiles.items():
+            try:
+                pixels = tile_futures[(x, y)].result()
+            except Exception:
+                # Warning: Failed to fetch/decode elevation tile {zoom}/{x}/{y}
+                continue
+
+            # Formula: elevation = -10000 + ((R * 256² + G * 256 + B) * 0.1)
+            rgb = pixels[pixel_y[members], pixel_x[members]].astype(np.int64)
+            elevations = -10000 + ((rgb[:, 0] * 256 * 256 + rgb[:, 1] * 256 + rgb[:, 2]) * 0.1)
+
+            for position, elevation in zip(members, elevations.tolist()):
+                results[indexes[position]] = round(elevation, 1)
+
+        return results
+
+
+
+    # ------------------------------------------------------------------------------------------------- #
+    #                                                                                                   #
+    #                                    SERVICE METHODS                                                #
+    #                                                                                                   #
+    # ------------------------------------------------------------------------------------------------- #
+
+    # Updates address fields using Mapbox reverse geocoding:
+    # commit=False sets the fields without saving (caller saves ADDRESS_FIELDS)
+    @staticmethod
+    def update_address_from_coordinates(location, commit=True):
+        data = LocationService._fetch_address_data(location)
+        if not LocationService._apply_address_data(location, data):
             return False
 
-        location.elevation = round(elevation, 1)
-        location.save(update_fields=['elevation'])
+        if commit:
+            location.save(update_fields=LocationService.ADDRESS_FIELDS)
+
+        # Info: Updated address for {location.name}: {location.formatted_address}
+        return True
+
+
+    # Updates elevation using Mapbox Terrain-DEM API (0.1m precision):
+    # precision='standard' trades accuracy for a smaller response (Tilequery, 10m contours)
+    # commit=False sets the field without saving (caller saves ELEVATION_FIELDS)
+    @staticmethod
+    def update_elevation_from_mapbox(location, precision='high', commit=True):
+        if precision == 'standard':
+            elevation = LocationService._fetch_contour_elevation(location)
+        else:
+            elevation = LocationService._fetch_elevation(location)
+        if elevation is None:
+            return False
+
+        location.elevation = elevation
+        if commit:
+            location.save(update_fields=LocationService.ELEVATION_FIELDS)
         # Info: Updated elevation for {location.name} to {location.elevation}m
         return True
 
 
+    # Updates elevation for many locations, fetching each Terrain-DEM tile once:
+    @staticmethod
+    def bulk_update_elevation(locations):
+        """
+        Batch version of update_elevation_from_mapbox for backfills and re-enrichment.
+
+        Elevations come from _fetch_elevations (each unique tile fetched and
+        decoded once) and are written with bulk_update in batches of
+        _BULK_UPDATE_BATCH_SIZE rows.
+
+        Returns:
+            int: Number of locations whose elevation was updated
+        """
+        from starview_app.models import Location
+
+        updated = []
+        for location, elevation in zip(locations, LocationService._fetch_elevations(locations)):
+            if elevation is not None:
+                location.elevation = elevation
+                updated.append(location)
+
+        if updated:
+            Location.objects.bulk_update(
+                updated,
+                LocationService.ELEVATION_FIELDS,
+                batch_size=_BULK_UPDATE_BATCH_SIZE,
+            )
+
+        # Info: Updated elevation for {len(updated)} of {len(locations)} locations
+        return len(updated)
+
+
     # Updates Bortle class and SQM using local GeoTIFF data:
     @staticmethod
-    def update_bortle_from_coordinates(location):
+    def update_bortle_from_coordinates(location, commit=True):
         """
         Fetch Bortle class from coordinates and save to location.
 
         Uses the calculate_bortle_for_coordinates utility which samples
         the World Atlas 2015 GeoTIFF file for light pollution data.
+        With commit=False the fields are set but not saved.
 
         Returns:
             True if Bortle data was successfully updated, False otherwise
@@ -193,7 +569,8 @@ class LocationService:
         if result:
             location.bortle_class = result['bortle']
             location.bortle_sqm = Decimal(str(result['sqm']))
-            location.save(update_fields=['bortle_class', 'bortle_sqm'])
+            if commit:
+                location.save(update_fields=LocationService.BORTLE_FIELDS)
             return True
         return False
 
@@ -205,23 +582,112 @@ class LocationService:
             # Info: Skipping external API calls for {location.name} (APIs disabled)
             return
 
+        # Fetch address and elevation concurrently (independent Mapbox round-trips).
+        # Only the HTTP work runs on the pool; saves stay on this thread's DB connection.
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            address_future = executor.submit(LocationService._fetch_address_data, location)
+            elevation_future = executor.submit(LocationService._fetch_elevation, location)
+
+        # Each step only sets fields; everything is written with one UPDATE at the end
+        updated_fields = []
+
         # Update address from coordinates
         try:
-            LocationService.update_address_from_coordinates(location)
+            if LocationService._apply_address_data(location, address_future.result()):
+                updated_fields += LocationService.ADDRESS_FIELDS
         except Exception as e:
             # Warning: Could not update address for {location.name}: {error}
             pass
 
         # Update elevation from Mapbox
         try:
-            LocationService.update_elevation_from_mapbox(location)
+            elevation = elevation_future.result()
+            if elevation is not None:
+                location.elevation = elevation
+                updated_fields += LocationService.ELEVATION_FIELDS
         except Exception as e:
             # Warning: Could not update elevation for {location.name}: {error}
             pass
 
         # Update Bortle class from GeoTIFF data
         try:
-            LocationService.update_bortle_from_coordinates(location)
+            if LocationService.update_bortle_from_coordinates(location, commit=False):
+                updated_fields += LocationService.BORTLE_FIELDS
         except Exception as e:
             # Warning: Could not update Bortle for {location.name}: {error}
-            pass
\ No newline at end of file
+            pass
+
+        if updated_fields:
+            try:
+                location.save(update_fields=updated_fields)
+            except Exception as e:
+                # Warning: Could not save enriched data for {location.name}: {error}
+                pass
+
+
+    # Initialize data for many locations at once (imports, re-enrichment):
+    @staticmethod
+    def initialize_many(locations):
+        """
+        Batch version of initialize_location_data.
+
+        Reverse geocoding requests run concurrently on a bounded thread pool
+        (_BATCH_WORKERS) alongside the tile-grouped elevation batch. Locations
+        with at least one successful step are written with bulk_update in
+        batches of _BULK_UPDATE_BATCH_SIZE rows instead of one UPDATE per
+        location.
+
+        Returns:
+            int: Number of locations written
+        """
+        from starview_app.models import Location
+
+        locations = list(locations)
+        if not locations or getattr(settings, 'DISABLE_EXTERNAL_APIS', False):
+            return 0
+
+        # HTTP only on the pool; the bulk_update below runs on this thread
+        with ThreadPoolExecutor(max_workers=_BATCH_WORKERS) as executor:
+            elevations_future = executor.submit(LocationService._fetch_elevations, locations)
+            address_futures = [
+                executor.submit(LocationService._fetch_address_data, location)
+                for location in locations
+            ]
+
+        try:
+            elevations = elevations_future.result()
+        except Exception as e:
+            # Warning: Could not fetch elevations for batch: {error}
+            elevations = [None] * len(locations)
+
+        enriched = []
+        for location, address_future, elevation in zip(locations, address_futures, elevations):
+            succeeded = False
+
+            try:
+                succeeded |= LocationService._apply_address_data(location, address_future.result())
+            except Exception as e:
+                # Warning: Could not update address for {location.name}: {error}
+                pass
+
+            if elevation is not None:
+                location.elevation = elevation
+                succeeded = True
+
+            try:
+                succeeded |= LocationService.update_bortle_from_coordinates(location, commit=False)
+            except Exception as e:
+                # Warning: Could not update Bortle for {location.name}: {error}
+                pass
+
+            if succeeded:
+                enriched.append(location)
+
+        if enriched:
+            # Fields of a location's failed steps are rewritten with their current values (no change)
+            Location.objects.bulk_update(
+                enriched,
+                LocationService.ADDRESS_FIELDS + LocationService.ELEVATION_FIELDS + LocationService.BORTLE_FIELDS,
+                batch_size=_BULK_UPDATE_BATCH_SIZE,
+            )
+        return len(enriched)
\ No newline at end of file
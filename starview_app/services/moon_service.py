@@ -14,12 +14,18 @@
 # ----------------------------------------------------------------------------------------------------- #
 
 import ephem
+import heapq
 import math
-from datetime import datetime, timedelta
+import numpy as np
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from operator import itemgetter
 from typing import Optional, Dict, List, Any
 from zoneinfo import ZoneInfo
 from timezonefinder import TimezoneFinder
 
+_UTC = timezone.utc
+
 # Singleton timezone finder (expensive to initialize)
 _tf = None
 
@@ -30,6 +36,18 @@ def _get_timezone_finder():
         _tf = TimezoneFinder()
     return _tf
 
+@lru_cache(maxsize=1024)
+def _get_local_timezone(lat: float, lng: float) -> Optional[ZoneInfo]:
+    """
+    Timezone for a location, memoized per coordinate pair.
+
+    A range query looks up the same location's timezone several times per day
+    in the range; each lookup is a point-in-polygon test. Keyed by the exact
+    coordinates so results near timezone borders are unchanged.
+    """
+    tz_name = _get_timezone_finder().timezone_at(lat=lat, lng=lng)
+    return ZoneInfo(tz_name) if tz_name else None
+
 # Phase name/emoji mappings based on illumination and waxing/waning state
 PHASE_DATA = {
     'new_moon': {'name': 'New Moon', 'emoji': '🌑'},
@@ -42,20 +60,111 @@ PHASE_DATA = {
     'waning_crescent': {'name': 'Waning Crescent', 'emoji': '🌘'},
 }
 
+# Per-phase result templates for get_phase_for_date; the None placeholders keep
+# the response key order and are filled in per call
+_PHASE_TEMPLATES = {
+    phase_key: {
+        'date': None,
+        'phase_name': phase_info['name'],
+        'phase_emoji': phase_info['emoji'],
+    }
+    for phase_key, phase_info in PHASE_DATA.items()
+}
+
 # Illumination threshold for "good stargazing" conditions (darker is better)
 STARGAZING_THRESHOLD = 25.0
 
+# Mean length of a lunation (new moon to new moon), in days
+SYNODIC_MONTH_DAYS = 29.530588
+
+# Phase fields copied into the unified API's 'current' and 'daily' entries
+PHASE_SUMMARY_KEYS = (
+    'phase_name',
+    'phase_emoji',
+    'illumination',
+    'phase_angle',
+    'is_waning',
+    'is_good_for_stargazing',
+)
+
+
+# Ephemeris results are memoized per minute of (naive UTC) time. Requests ask for
+# the same instants repeatedly - the "current" entry and every daily entry within
+# a day of today use "now" - and neither the phase nor the moon's orientation
+# changes visibly within a minute.
+def _to_minute(when: datetime) -> datetime:
+    """Truncate a naive UTC datetime to the minute (memoization key)."""
+    return when.replace(second=0, microsecond=0)
+
+
+@lru_cache(maxsize=512)
+def _ephem_degrees(value: float) -> ephem.Angle:
+    """
+    Parse a coordinate in degrees into an ephem angle (radians), memoized.
+
+    Assigning str(lat) to an Observer re-runs ephem's sexagesimal string parser
+    on every call; a range query builds several observers per day for the same
+    location, so the parsed angle is reused instead.
+    """
+    return ephem.degrees(str(value))
+
+
+@lru_cache(maxsize=4096)
+def _moon_phase_state_at(when: datetime) -> tuple:
+    """
+    Moon illumination and elongation at a minute-truncated UTC time.
+
+    Returns:
+        tuple: (illumination 0-100, elongation in radians - positive when the
+               moon is east of the sun, i.e. waxing)
+    """
+    observer = ephem.Observer()
+    observer.date = ephem.Date(when)
+
+    moon = ephem.Moon()
+    moon.compute(observer)
+    return float(moon.phase), float(moon.elong)
+
+
+@lru_cache(maxsize=4096)
+def _sky_positions_at(when: datetime, lat: float, lng: float) -> tuple:
+    """
+    Moon/sun equatorial positions and local sidereal time for an observer.
+
+    Returns:
+        tuple: (ra_moon, dec_moon, ra_sun, dec_sun, lst) in radians
+    """
+    observer = ephem.Observer()
+    observer.lat = _ephem_degrees(lat)
+    observer.lon = _ephem_degrees(lng)
+    observer.date = ephem.Date(when)
+
+    moon = ephem.Moon()
+    moon.compute(observer)
+
+    sun = ephem.Sun()
+    sun.compute(observer)
+
+    return (
+        float(moon.ra), float(moon.dec),
+        float(sun.ra), float(sun.dec),
+        float(observer.sidereal_time()),
+    )
+
 
 def get_phase_for_date(
     date: datetime,
     lat: Optional[float] = None,
-    lng: Optional[float] = None
+    lng: Optional[float] = None,
+    include_rise_set: bool = True
 ) -> Dict[str, Any]:
     """
     Calculate moon phase data for a specific date.
 
     Returns dictionary with phase_name, phase_emoji, illumination, phase_angle,
     is_good_for_stargazing, and optionally moonrise/moonset times if location provided.
+    Pass include_rise_set=False to skip the next moonrise/moonset lookup, which
+    depends only on the location (not the date).
 
     For illumination: Uses current UTC time if date is today, otherwise noon UTC.
     For moonrise/moonset: Calculates for the observer's local date and converts to local time.
@@ -69,7 +178,7 @@ def get_phase_for_date(
     #
     # For real-time accuracy, use current UTC time if the target date is within
     # ±1 day of UTC today. This ensures users worldwide get accurate live data.
-    now = datetime.utcnow()
+    now = datetime.now(_UTC).replace(tzinfo=None)
     today = now.date()
     target_date = date.date() if isinstance(date, datetime) else date
 
@@ -80,38 +189,34 @@ def get_phase_for_date(
     else:
         # Future or past dates: use noon UTC for consistency
         calc_time = datetime(target_date.year, target_date.month, target_date.day, 12, 0, 0)
+    calc_time = _to_minute(calc_time)
 
-    observer = ephem.Observer()
-    observer.date = ephem.Date(calc_time)
-
-    moon = ephem.Moon()
-    moon.compute(observer)
+    moon_phase, elongation = _moon_phase_state_at(calc_time)
 
     # Get illumination percentage (0-100)
-    illumination = round(moon.phase, 1)
+    illumination = round(moon_phase, 1)
 
     # Get phase angle (ephem.phase is 0-100, convert to degrees 0-360)
-    phase_angle = round(float(moon.phase) * 3.6, 1)
+    phase_angle = round(moon_phase * 3.6, 1)
 
     # Determine phase name based on illumination and trend
-    phase_key, is_waning = _determine_phase(calc_time, illumination)
-    phase_info = PHASE_DATA[phase_key]
-
-    result = {
-        'date': date.strftime('%Y-%m-%d'),
-        'phase_name': phase_info['name'],
-        'phase_emoji': phase_info['emoji'],
-        'illumination': illumination,
-        'phase_angle': phase_angle,
-        'is_waning': is_waning,
-        'is_good_for_stargazing': illumination < STARGAZING_THRESHOLD,
-    }
+    phase_key, is_waning = _determine_phase(illumination, elongation)
+
+    result = _PHASE_TEMPLATES[phase_key].copy()
+    result.update(
+        date=date.strftime('%Y-%m-%d'),
+        illumination=illumination,
+        phase_angle=phase_angle,
+        is_waning=is_waning,
+        is_good_for_stargazing=illumination < STARGAZING_THRESHOLD,
+    )
 
     # Add next moonrise/moonset and rotation angle if location provided
     if lat is not None and lng is not None:
-        rise_set_data = _get_next_moonrise_moonset(lat, lng)
-        result['next_moonrise'] = rise_set_data['moonrise']
-        result['next_moonset'] = rise_set_data['moonset']
+        if include_rise_set:
+            rise_set_data = _get_next_moonrise_moonset(lat, lng)
+            result['next_moonrise'] = rise_set_data['moonrise']
+            result['next_moonset'] = rise_set_data['moonset']
 
         # Calculate rotation angle for accurate moon display
         # _get_moon_rotation_angle returns θ: where bright limb SHOULD be from "up"
@@ -136,55 +241,53 @@ def _get_moon_rotation_angle(calc_time: datetime, lat: float, lng: float) -> flo
     """
     Calculate the rotation angle for displaying the moon as seen from a specific location.
 
-    This combines two angles:
-    1. Position angle of the bright limb - which direction the sun is relative to the moon
-       (determines which side of the moon is illuminated)
-    2. Parallactic angle - how the celestial coordinate system is tilted relative to
-       the observer's horizon (depends on latitude and moon's position in sky)
+    Single-time form of _get_moon_rotation_angles (see there for the calculation).
 
     Returns angle in degrees for rotating the moon graphic, where:
     - 0 means the bright limb is at the top
     - Positive values rotate clockwise
     """
-    observer = ephem.Observer()
-    observer.lat = str(lat)
-    observer.lon = str(lng)
-    observer.date = ephem.Date(calc_time)
+    return float(_get_moon_rotation_angles([calc_time], lat, lng)[0])
 
-    moon = ephem.Moon()
-    moon.compute(observer)
 
-    sun = ephem.Sun()
-    sun.compute(observer)
+def _get_moon_rotation_angles(calc_times: List[datetime], lat: float, lng: float) -> np.ndarray:
+    """
+    Calculate the moon's display rotation angle at several times for one location.
+
+    This combines two angles:
+    1. Position angle of the bright limb - which direction the sun is relative to the moon
+       (determines which side of the moon is illuminated)
+    2. Parallactic angle - how the celestial coordinate system is tilted relative to
+       the observer's horizon (depends on latitude and moon's position in sky)
+
+    Sky positions are computed (and memoized) per time by ephem; the trigonometry
+    then runs once over arrays, so a date range costs one NumPy pass.
+
+    Returns array of rotation angles in degrees, in the same order as calc_times.
+    """
+    positions = np.array(
+        [_sky_positions_at(_to_minute(calc_time), lat, lng) for calc_time in calc_times],
+        dtype=np.float64,
+    ).reshape(-1, 5)
+    ra_moon, dec_moon, ra_sun, dec_sun, lst = positions.T
 
     # === Position Angle of the Bright Limb ===
     # This is the angle from celestial north to the sun, measured eastward from the moon
     # It tells us which side of the moon is illuminated
-    ra_moon = float(moon.ra)
-    dec_moon = float(moon.dec)
-    ra_sun = float(sun.ra)
-    dec_sun = float(sun.dec)
-
-    # Calculate position angle from moon to sun
     delta_ra = ra_sun - ra_moon
-    position_angle = math.atan2(
-        math.cos(dec_sun) * math.sin(delta_ra),
-        math.sin(dec_sun) * math.cos(dec_moon) - math.cos(dec_sun) * math.sin(dec_moon) * math.cos(delta_ra)
+    position_angle = np.arctan2(
+        np.cos(dec_sun) * np.sin(delta_ra),
+        np.sin(dec_sun) * np.cos(dec_moon) - np.cos(dec_sun) * np.sin(dec_moon) * np.cos(delta_ra)
     )
 
     # === Parallactic Angle ===
     # How much the celestial coordinate system is tilted from the observer's perspective
-    lst = float(observer.sidereal_time())
     hour_angle = lst - ra_moon
-
-    lat_rad = math.radians(lat)
-    sin_h = math.sin(hour_angle)
-    cos_h = math.cos(hour_angle)
-    sin_dec = math.sin(dec_moon)
-    cos_dec = math.cos(dec_moon)
-    tan_lat = math.tan(lat_rad)
-
-    parallactic = math.atan2(sin_h, tan_lat * cos_dec - sin_dec * cos_h)
+    tan_lat = math.tan(math.radians(lat))
+    parallactic = np.arctan2(
+        np.sin(hour_angle),
+        tan_lat * np.cos(dec_moon) - np.sin(dec_moon) * np.cos(hour_angle)
+    )
 
     # === Combined Rotation ===
     # The bright limb angle in horizon coordinates
@@ -195,55 +298,67 @@ def _get_moon_rotation_angle(calc_time: datetime, lat: float, lng: float) -> flo
 
     # Convert to degrees and normalize to -180 to 180
     # Negate because CSS rotation is clockwise but astronomical angles are counter-clockwise
-    rotation_deg = -math.degrees(rotation)
+    rotation_deg = -np.degrees(rotation)
     rotation_deg = ((rotation_deg + 180) % 360) - 180
 
-    return round(rotation_deg, 1)
+    return np.round(rotation_deg, 1)
+
+
+# Phase bands: 0=new, 1=crescent, 2=quarter, 3=gibbous, 4=full
+#
+# Thresholds based on scientific definitions (U.S. Naval Observatory):
+# - Primary phases (New, Quarter, Full) are specific moments, not ranges
+# - Crescent: <50% illumination, Gibbous: >50% illumination
+#
+# We use a 6% window (47-53%) for quarter phases, which corresponds to
+# roughly 1 day around the actual quarter event (~6-7% change per day).
+# This balances scientific accuracy with practical display needs.
+def _illumination_band(illumination: float) -> int:
+    if illumination < 2:
+        return 0
+    if illumination > 98:
+        return 4
+    if 47 <= illumination <= 53:
+        return 2
+    return 1 if illumination < 47 else 3
+
+
+# Band for every illumination in tenths of a percent (0.0-100.0), built once so
+# classifying a day is a table lookup rather than a comparison cascade
+_BAND_BY_TENTH = bytes(_illumination_band(tenth / 10) for tenth in range(1001))
 
+# Phase key per band, indexed [band][is_waxing]
+_PHASE_KEYS_BY_BAND = (
+    ('new_moon', 'new_moon'),
+    ('waning_crescent', 'waxing_crescent'),
+    ('last_quarter', 'first_quarter'),
+    ('waning_gibbous', 'waxing_gibbous'),
+    ('full_moon', 'full_moon'),
+)
 
-def _determine_phase(calc_time: datetime, illumination: float) -> tuple[str, bool]:
+
+def _determine_phase(illumination: float, elongation: float) -> tuple[str, bool]:
     """
     Determine the phase name and waning status based on illumination and trend.
 
-    Compares illumination at calc_time with illumination 24 hours later to determine
-    if the moon is waxing (getting brighter) or waning (getting dimmer).
+    Uses the sign of the moon's elongation from the sun to determine if the moon
+    is waxing (east of the sun, getting brighter) or waning (west of the sun,
+    getting dimmer), so no second ephemeris computation is needed.
+
+    Illumination is looked up at one-decimal precision, matching the rounded
+    value get_phase_for_date reports.
 
     Returns:
         tuple: (phase_key, is_waning) where phase_key is used for PHASE_DATA lookup
     """
-    # Check if waxing (illumination increasing) or waning
-    # Compare with 24 hours later
-    tomorrow_time = calc_time + timedelta(days=1)
-    observer_tomorrow = ephem.Observer()
-    observer_tomorrow.date = ephem.Date(tomorrow_time)
-    moon_tomorrow = ephem.Moon()
-    moon_tomorrow.compute(observer_tomorrow)
-    tomorrow_illumination = moon_tomorrow.phase
-
-    is_waxing = tomorrow_illumination > illumination
-    is_waning = not is_waxing
-
-    # Determine phase based on illumination percentage and trend
-    #
-    # Thresholds based on scientific definitions (U.S. Naval Observatory):
-    # - Primary phases (New, Quarter, Full) are specific moments, not ranges
-    # - Crescent: <50% illumination, Gibbous: >50% illumination
-    #
-    # We use a 6% window (47-53%) for quarter phases, which corresponds to
-    # roughly 1 day around the actual quarter event (~6-7% change per day).
-    # This balances scientific accuracy with practical display needs.
-    if illumination < 2:
-        phase_key = 'new_moon'
-    elif illumination > 98:
-        phase_key = 'full_moon'
-    elif 47 <= illumination <= 53:
-        phase_key = 'first_quarter' if is_waxing else 'last_quarter'
-    elif illumination < 47:
-        phase_key = 'waxing_crescent' if is_waxing else 'waning_crescent'
-    else:  # illumination > 53
-        phase_key = 'waxing_gibbous' if is_waxing else 'waning_gibbous'
+    # The moon is waxing from new moon (conjunction) until full moon (opposition),
+    # i.e. while it is east of the sun (positive elongation)
+    is_waxing = elongation > 0
 
-    return phase_key, is_waning
+    tenth = min(max(int(round(illumination * 10)), 0), 1000)
+    phase_key = _PHASE_KEYS_BY_BAND[_BAND_BY_TENTH[tenth]][is_waxing]
+
+    return phase_key, not is_waxing
 
 
 def _get_moon_transit_time(
@@ -261,13 +376,10 @@ def _get_moon_transit_time(
     Returns:
         UTC datetime of moon transit, or None if transit doesn't occur on this date
     """
-    tf = _get_timezone_finder()
-    tz_name = tf.timezone_at(lat=lat, lng=lng)
-    if not tz_name:
+    local_tz = _get_local_timezone(lat, lng)
+    if local_tz is None:
         return None
 
-    local_tz = ZoneInfo(tz_name)
-
     # Get the target date
     if isinstance(target_date, datetime):
         target_local = target_date.date()
@@ -276,12 +388,12 @@ def _get_moon_transit_time(
 
     # Start from beginning of the day in local timezone
     day_start_local = datetime(target_local.year, target_local.month, target_local.day, 0, 0, 0, tzinfo=local_tz)
-    day_start_utc = day_start_local.astimezone(ZoneInfo('UTC')).replace(tzinfo=None)
+    day_start_utc = day_start_local.astimezone(_UTC).replace(tzinfo=None)
 
     # Set up observer
     observer = ephem.Observer()
-    observer.lat = str(lat)
-    observer.lon = str(lng)
+    observer.lat = _ephem_degrees(lat)
+    observer.lon = _ephem_degrees(lng)
     observer.date = ephem.Date(day_start_utc)
 
     moon = ephem.Moon()
@@ -289,7 +401,7 @@ def _get_moon_transit_time(
     try:
         transit_time_ephem = observer.next_transit(moon)
         transit_time_utc = ephem.Date(transit_time_ephem).datetime()
-        transit_time_local = transit_time_utc.replace(tzinfo=ZoneInfo('UTC')).astimezone(local_tz)
+        transit_time_local = transit_time_utc.replace(tzinfo=_UTC).astimezone(local_tz)
 
         # Check if transit occurs on the target date
         if transit_time_local.date() == target_local:
@@ -319,13 +431,10 @@ def _get_moonrise_moonset_for_date(
         moonset: "HH:MM" or None if no moonset on this day
     """
     # Get timezone for this location
-    tf = _get_timezone_finder()
-    tz_name = tf.timezone_at(lat=lat, lng=lng)
-    if not tz_name:
+    local_tz = _get_local_timezone(lat, lng)
+    if local_tz is None:
         return {'moonrise': None, 'moonset': None}
 
-    local_tz = ZoneInfo(tz_name)
-
     # Get the target date in local timezone
     if isinstance(target_date, datetime):
         target_local = target_date.date()
@@ -336,13 +445,13 @@ def _get_moonrise_moonset_for_date(
     day_start_local = datetime(target_local.year, target_local.month, target_local.day, 0, 0, 0, tzinfo=local_tz)
     day_end_local = datetime(target_local.year, target_local.month, target_local.day, 23, 59, 59, tzinfo=local_tz)
 
-    day_start_utc = day_start_local.astimezone(ZoneInfo('UTC')).replace(tzinfo=None)
-    day_end_utc = day_end_local.astimezone(ZoneInfo('UTC')).replace(tzinfo=None)
+    day_start_utc = day_start_local.astimezone(_UTC).replace(tzinfo=None)
+    day_end_utc = day_end_local.astimezone(_UTC).replace(tzinfo=None)
 
     # Set up observer
     observer = ephem.Observer()
-    observer.lat = str(lat)
-    observer.lon = str(lng)
+    observer.lat = _ephem_degrees(lat)
+    observer.lon = _ephem_degrees(lng)
 
     moon = ephem.Moon()
     result = {'moonrise': None, 'moonset': None}
@@ -351,7 +460,7 @@ def _get_moonrise_moonset_for_date(
     observer.date = ephem.Date(day_start_utc)
     try:
         rise_time_ephem = observer.next_rising(moon)
-        rise_time_utc = ephem.Date(rise_time_ephem).datetime().replace(tzinfo=ZoneInfo('UTC'))
+        rise_time_utc = ephem.Date(rise_time_ephem).datetime().replace(tzinfo=_UTC)
         rise_time_local = rise_time_utc.astimezone(local_tz)
 
         # Check if this rise occurs on the target date
@@ -364,7 +473,7 @@ def _get_moonrise_moonset_for_date(
     observer.date = ephem.Date(day_start_utc)
     try:
         set_time_ephem = observer.next_setting(moon)
-        set_time_utc = ephem.Date(set_time_ephem).datetime().replace(tzinfo=ZoneInfo('UTC'))
+        set_time_utc = ephem.Date(set_time_ephem).datetime().replace(tzinfo=_UTC)
         set_time_local = set_time_utc.astimezone(local_tz)
 
         # Check if this set occurs on the target date
@@ -392,21 +501,19 @@ def _get_next_moonrise_moonset(
         moonset: { time: "HH:MM", label: "Today"/"Tomorrow"/weekday, date: "YYYY-MM-DD" }
     """
     # Get timezone for this location
-    tf = _get_timezone_finder()
-    tz_name = tf.timezone_at(lat=lat, lng=lng)
-    if not tz_name:
+    local_tz = _get_local_timezone(lat, lng)
+    if local_tz is None:
         return {'moonrise': None, 'moonset': None}
-
-    local_tz = ZoneInfo(tz_name)
-    now_utc = datetime.utcnow()
-    now_local = now_utc.replace(tzinfo=ZoneInfo('UTC')).astimezone(local_tz)
+    now_utc = datetime.now(_UTC)
+    now_local = now_utc.astimezone(local_tz)
+    search_start = ephem.Date(now_utc.replace(tzinfo=None))
     today_local = now_local.date()
 
     # Set up observer at the location, starting from now
     observer = ephem.Observer()
-    observer.lat = str(lat)
-    observer.lon = str(lng)
-    observer.date = ephem.Date(now_utc)
+    observer.lat = _ephem_degrees(lat)
+    observer.lon = _ephem_degrees(lng)
+    observer.date = search_start
 
     moon = ephem.Moon()
 
@@ -425,7 +532,7 @@ def _get_next_moonrise_moonset(
     # Find next moonrise
     try:
         rise_time_ephem = observer.next_rising(moon)
-        rise_time_utc = ephem.Date(rise_time_ephem).datetime().replace(tzinfo=ZoneInfo('UTC'))
+        rise_time_utc = ephem.Date(rise_time_ephem).datetime().replace(tzinfo=_UTC)
         rise_time_local = rise_time_utc.astimezone(local_tz)
         rise_date = rise_time_local.date()
 
@@ -438,12 +545,12 @@ def _get_next_moonrise_moonset(
         pass
 
     # Reset observer to find moonset
-    observer.date = ephem.Date(now_utc)
+    observer.date = search_start
 
     # Find next moonset
     try:
         set_time_ephem = observer.next_setting(moon)
-        set_time_utc = ephem.Date(set_time_ephem).datetime().replace(tzinfo=ZoneInfo('UTC'))
+        set_time_utc = ephem.Date(set_time_ephem).datetime().replace(tzinfo=_UTC)
         set_time_local = set_time_utc.astimezone(local_tz)
         set_date = set_time_local.date()
 
@@ -462,18 +569,28 @@ def get_phases_for_range(
     start_date: datetime,
     end_date: datetime,
     lat: Optional[float] = None,
-    lng: Optional[float] = None
+    lng: Optional[float] = None,
+    include_rise_set: bool = True
 ) -> List[Dict[str, Any]]:
     """
     Calculate moon phases for a date range.
 
     Returns list of phase dictionaries, one per day in the range (inclusive).
+    The next moonrise/moonset is the same for every day, so it is computed once
+    and shared across the range (or skipped with include_rise_set=False).
     """
     phases = []
     current = start_date
     while current <= end_date:
-        phases.append(get_phase_for_date(current, lat, lng))
+        phases.append(get_phase_for_date(current, lat, lng, include_rise_set=False))
         current += timedelta(days=1)
+
+    if include_rise_set and lat is not None and lng is not None:
+        rise_set_data = _get_next_moonrise_moonset(lat, lng)
+        for phase in phases:
+            phase['next_moonrise'] = rise_set_data['moonrise']
+            phase['next_moonset'] = rise_set_data['moonset']
+
     return phases
 
 
@@ -484,14 +601,21 @@ def get_next_key_dates(from_date: datetime) -> Dict[str, str]:
     Returns dictionary with next_new_moon, next_full_moon,
     next_first_quarter, and next_last_quarter dates.
     """
+    # Callers pass the start of a day, so the memo key is effectively per-day
+    return dict(_next_key_dates_cached(from_date))
+
+
+@lru_cache(maxsize=64)
+def _next_key_dates_cached(from_date: datetime) -> tuple:
+    """Memoized get_next_key_dates as (key, date) pairs (immutable, rebuilt per call)."""
     date = ephem.Date(from_date)
 
-    return {
-        'next_new_moon': ephem.Date(ephem.next_new_moon(date)).datetime().strftime('%Y-%m-%d'),
-        'next_full_moon': ephem.Date(ephem.next_full_moon(date)).datetime().strftime('%Y-%m-%d'),
-        'next_first_quarter': ephem.Date(ephem.next_first_quarter_moon(date)).datetime().strftime('%Y-%m-%d'),
-        'next_last_quarter': ephem.Date(ephem.next_last_quarter_moon(date)).datetime().strftime('%Y-%m-%d'),
-    }
+    return (
+        ('next_new_moon', ephem.Date(ephem.next_new_moon(date)).datetime().strftime('%Y-%m-%d')),
+        ('next_full_moon', ephem.Date(ephem.next_full_moon(date)).datetime().strftime('%Y-%m-%d')),
+        ('next_first_quarter', ephem.Date(ephem.next_first_quarter_moon(date)).datetime().strftime('%Y-%m-%d')),
+        ('next_last_quarter', ephem.Date(ephem.next_last_quarter_moon(date)).datetime().strftime('%Y-%m-%d')),
+    )
 
 
 def get_key_dates_in_range(
@@ -503,7 +627,6 @@ def get_key_dates_in_range(
 
     Returns list of key phase events sorted by date.
     """
-    key_dates = []
     date = ephem.Date(start_date)
     end = ephem.Date(end_date)
 
@@ -515,23 +638,37 @@ def get_key_dates_in_range(
         (ephem.next_last_quarter_moon, 'Last Quarter', '🌗', 50.0),
     ]
 
-    for func, name, emoji, illumination in phase_funcs:
+    def phase_events(func, name, emoji, illumination):
+        """Yield (ephem date, name, emoji, illumination) for one phase, in date order."""
         current = date
         while True:
             next_date = func(current)
             if next_date > end:
-                break
-            key_dates.append({
-                'date': ephem.Date(next_date).datetime().strftime('%Y-%m-%d'),
-                'phase_name': name,
-                'phase_emoji': emoji,
-                'illumination': illumination,
-            })
-            current = next_date + 1  # Move past this date to find next occurrence
+                return
+            yield next_date, name, emoji, illumination
+            # The same phase recurs one synodic month later (29.27-29.83 days), so
+            # start the next search just before it rather than a day after this one
+            current = next_date + SYNODIC_MONTH_DAYS - 2
+
+    # Each phase's stream is already sorted, so merge them (on the ephem date itself,
+    # a float) instead of sorting; dates are formatted once, for the merged result
+    return [
+        {
+            'date': ephem.Date(event_date).datetime().strftime('%Y-%m-%d'),
+            'phase_name': name,
+            'phase_emoji': emoji,
+            'illumination': illumination,
+        }
+        for event_date, name, emoji, illumination in heapq.merge(
+            *(phase_events(*phase) for phase in phase_funcs),
+            key=itemgetter(0)
+        )
+    ]
 
-    # Sort by date
-    key_dates.sort(key=lambda x: x['date'])
-    return key_dates
+
+def get_phase_summary(phase: Dict[str, Any]) -> Dict[str, Any]:
+    """Project a get_phase_for_date result onto the unified API's phase fields."""
+    return {key: phase[key] for key in PHASE_SUMMARY_KEYS}
 
 
 def get_moon_data_unified(
@@ -559,9 +696,7 @@ def get_moon_data_unified(
         - current: Real-time phase data for NOW
         - daily: Array of daily phase data with data_type: "computed"
     """
-    from datetime import timezone as tz
-
-    now = datetime.now(tz.utc)
+    now = datetime.now(_UTC)
 
     # Build response
     response: Dict[str, Any] = {
@@ -579,15 +714,7 @@ def get_moon_data_unified(
 
     # Get current (NOW) moon data
     current_phase = get_phase_for_date(now, lat, lng)
-    response['current'] = {
-        'timestamp': now.isoformat(),
-        'phase_name': current_phase.get('phase_name'),
-        'phase_emoji': current_phase.get('phase_emoji'),
-        'illumination': current_phase.get('illumination'),
-        'phase_angle': current_phase.get('phase_angle'),
-        'is_waning': current_phase.get('is_waning'),
-        'is_good_for_stargazing': current_phase.get('is_good_for_stargazing'),
-    }
+    response['current'] = {'timestamp': now.isoformat(), **get_phase_summary(current_phase)}
 
     # Add moonrise/moonset to current if location provided
     if lat is not None and lng is not None:
@@ -596,23 +723,18 @@ def get_moon_data_unified(
         response['current']['rotation_angle'] = current_phase.get('rotation_angle')
 
     # Get daily phase data for the date range
-    phases = get_phases_for_range(start_date, end_date, lat, lng)
+    # (next moonrise/moonset is only reported on 'current', so skip it per day)
+    phases = get_phases_for_range(start_date, end_date, lat, lng, include_rise_set=False)
+
+    # Days with a transit get their rotation angle in one vectorized pass below
+    transit_entries = []
 
     for phase in phases:
-        daily_entry = {
-            'date': phase.get('date'),
-            'data_type': 'computed',
-            'phase_name': phase.get('phase_name'),
-            'phase_emoji': phase.get('phase_emoji'),
-            'illumination': phase.get('illumination'),
-            'phase_angle': phase.get('phase_angle'),
-            'is_waning': phase.get('is_waning'),
-            'is_good_for_stargazing': phase.get('is_good_for_stargazing'),
-        }
+        daily_entry = {'date': phase['date'], 'data_type': 'computed', **get_phase_summary(phase)}
 
         # Include location-based data if coordinates provided
         if lat is not None and lng is not None:
-            phase_date = datetime.strptime(phase.get('date'), '%Y-%m-%d')
+            phase_date = datetime.strptime(phase['date'], '%Y-%m-%d')
 
             # Get moonrise/moonset for this specific day
             rise_set = _get_moonrise_moonset_for_date(phase_date, lat, lng)
@@ -623,12 +745,16 @@ def get_moon_data_unified(
             # This is more accurate than noon for showing how the moon will appear
             transit_time = _get_moon_transit_time(phase_date, lat, lng)
             if transit_time:
-                # Use transit time for rotation calculation
-                daily_entry['rotation_angle'] = _get_moon_rotation_angle(transit_time, lat, lng)
+                transit_entries.append((daily_entry, transit_time))
             elif 'rotation_angle' in phase:
                 # Fallback to noon-based rotation if no transit on this day
                 daily_entry['rotation_angle'] = phase.get('rotation_angle')
 
         response['daily'].append(daily_entry)
 
+    if transit_entries:
+        angles = _get_moon_rotation_angles([transit_time for _, transit_time in transit_entries], lat, lng)
+        for (daily_entry, _), angle in zip(transit_entries, angles.tolist()):
+            daily_entry['rotation_angle'] = angle
+
     return response
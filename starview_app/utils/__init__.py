@@ -16,6 +16,7 @@
 # - validators.py: File upload validation, coordinate validation, XSS sanitization                      #
 # - throttles.py: DRF rate limiting classes (login, content creation, voting, reporting)                #
 # - cache.py: Redis caching utilities (key generation, invalidation helpers)                            #
+# - queries.py: Shared ORM expression helpers (correlated COUNT subqueries)                            #
 # - audit_logger.py: Security audit logging (authentication events, admin actions)                      #
 # - exception_handler.py: Global exception handler for consistent error responses (Phase 4)             #
 # - signals.py: Django signal handlers (file cleanup, aggregate updates)                                #
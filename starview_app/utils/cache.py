@@ -112,6 +112,9 @@ WEATHER_HIST_AVG_CACHE_TIMEOUT = 2592000    # 30 days - statistical averages are
 MOON_CACHE_TIMEOUT = 86400                  # 24 hours - moon data with location
 MOON_NO_LOCATION_CACHE_TIMEOUT = 604800     # 7 days - moon phases without location
 BORTLE_CACHE_TIMEOUT = 2592000              # 30 days - light pollution changes slowly (years)
+GEOCODE_CACHE_TIMEOUT = 172800              # 48 hours - reverse geocoding for location enrichment
+ELEVATION_CACHE_TIMEOUT = 2592000           # 30 days - terrain data is static
+TERRAIN_TILE_CACHE_TIMEOUT = 604800         # 7 days - raw Terrain-DEM tiles (larger values)
 
 # Legacy constant for backward compatibility
 WEATHER_CACHE_TIMEOUT = WEATHER_FORECAST_CACHE_TIMEOUT
@@ -222,6 +225,58 @@ def bortle_cache_key(lat, lng):
     return f'bortle:{rounded_lat}:{rounded_lng}'
 
 
+def geocode_cache_key(lat, lng):
+    """
+    Cache key for Mapbox reverse geocoding results (locality/region/country).
+
+    Uses 3 decimal precision (~100m grid) - nearby locations share the same
+    city, region and country, so they reuse one geocoding response.
+
+    Args:
+        lat: Latitude
+        lng: Longitude
+
+    Returns:
+        Cache key string
+    """
+    rounded_lat = round(float(lat), 3)
+    rounded_lng = round(float(lng), 3)
+    return f'geocode:{rounded_lat}:{rounded_lng}'
+
+
+def elevation_cache_key(zoom, tile_x, tile_y, pixel_x, pixel_y):
+    """
+    Cache key for Mapbox Terrain-DEM elevation samples.
+
+    Keyed by the tile pixel the elevation is read from rather than rounded
+    coordinates, so every location that maps to the same pixel shares an
+    entry and cached values are exactly what the API would return.
+
+    Args:
+        zoom: Tile zoom level
+        tile_x, tile_y: Tile coordinates
+        pixel_x, pixel_y: Pixel position within the 256x256 tile
+
+    Returns:
+        Cache key string
+    """
+    return f'elevation:{zoom}:{tile_x}:{tile_y}:{pixel_x}:{pixel_y}'
+
+
+def terrain_tile_cache_key(zoom, tile_x, tile_y):
+    """
+    Cache key for raw Mapbox Terrain-DEM tile images.
+
+    Args:
+        zoom: Tile zoom level
+        tile_x, tile_y: Tile coordinates
+
+    Returns:
+        Cache key string
+    """
+    return f'terrain_tile:{zoom}:{tile_x}:{tile_y}'
+
+
 # Legacy function for backward compatibility (deprecated)
 def weather_cache_key(lat, lng):
     """
@@ -0,0 +1,40 @@
+# ----------------------------------------------------------------------------------------------------- #
+# This queries.py file provides shared ORM expression helpers:                                          #
+#                                                                                                       #
+# Purpose:                                                                                              #
+# Builds correlated COUNT subqueries used as annotations. Several of them in one SELECT cost a single   #
+# round-trip, and unlike joined Count(distinct=True) they never multiply rows across one-to-many        #
+# relations.                                                                                            #
+#                                                                                                       #
+# Functions:                                                                                            #
+# - count_subquery(): COUNT(*) of a queryset filtered on OuterRef(...), optionally capped at a limit    #
+#                                                                                                       #
+# Usage Example:                                                                                        #
+#   from starview_app.utils.queries import count_subquery                                               #
+#                                                                                                       #
+#   User.objects.annotate(review_count=count_subquery(Review.objects.filter(user=OuterRef('pk'))))      #
+# ----------------------------------------------------------------------------------------------------- #
+
+# Import tools:
+from django.db.models import F, Func, IntegerField, Subquery
+from django.db.models.functions import Coalesce
+
+
+# COUNT(*) over a LIMITed subquery: the database stops reading matching rows
+# once `limit` are found, so the result is min(true count, limit).
+class _BoundedCount(Subquery):
+    template = '(SELECT COUNT(*) FROM (%(subquery)s) _bounded)'
+    output_field = IntegerField()
+
+
+# COUNT(*) of `queryset` rows matching the outer row (the queryset filters on an
+# OuterRef), as a scalar subquery usable in annotate()/update(). With `limit`, the
+# count is capped there so the database can stop scanning early.
+def count_subquery(queryset, limit=None):
+    if limit is not None:
+        return _BoundedCount(queryset.order_by().values('pk')[:limit])
+
+    counted = queryset.order_by().annotate(
+        _count=Func(F('pk'), function='COUNT')
+    ).values('_count')
+    return Coalesce(Subquery(counted, output_field=IntegerField()), 0)
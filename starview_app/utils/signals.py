@@ -13,6 +13,9 @@
 # Email Verification Signals (email_confirmed):                                                         #
 # - Email confirmed → Deletes EmailConfirmation token to prevent database bloat                         #
 #                                                                                                       #
+# Activity Counter Signals (post_save, post_delete):                                                    #
+# - Visit/location/follow/comment/photo created or deleted → Adjust the owner's UserProfile counter     #
+#                                                                                                       #
 # Badge Checking Signals (post_save):                                                                   #
 # 1. LocationVisit created → Check exploration badges (visit count)                                     #
 # 2. Location created → Check contribution badges (location adds)                                       #
@@ -38,6 +41,8 @@
 # Import tools:
 import os
 import logging
+from django.db import transaction
+from django.db.models import Count, F
 from django.db.models.signals import pre_delete, post_delete, post_save
 from django.dispatch import receiver
 from django.conf import settings
@@ -57,6 +62,7 @@ from starview_app.models import LocationVisit
 from starview_app.models import Follow
 from starview_app.models import ReviewComment
 from starview_app.models import Vote
+from starview_app.models import Badge
 
 # Import allauth signals and models:
 from allauth.account.signals import email_confirmed
@@ -102,6 +108,24 @@ def get_comment_content_type():
 
 
 
+# ----------------------------------------------------------------------------- #
+# Run badge checks for a user off the request path when a worker is available.  #
+#                                                                               #
+# With CELERY_ENABLED, checks are queued as a check_user_badges task once the   #
+# current transaction commits (so the worker sees the new row). Otherwise they  #
+# run inline, as before. Either way all categories share one count query.       #
+# ----------------------------------------------------------------------------- #
+def queue_badge_checks(user, *categories):
+    if getattr(settings, 'CELERY_ENABLED', False):
+        from starview_app.utils.tasks import check_user_badges
+        user_id = user.id
+        transaction.on_commit(lambda: check_user_badges.delay(user_id, list(categories)))
+    else:
+        from starview_app.services.badge_service import BadgeService
+        BadgeService.check_all_for_user(user, categories)
+
+
+
 # ----------------------------------------------------------------------------------------------------- #
 #                                                                                                       #
 #                                           SIGNAL METHODS                                              #
@@ -329,6 +353,40 @@ def create_or_update_user_profile(sender, instance, created, **kwargs):
         UserProfile.objects.get_or_create(user=instance)  # Create profile for existing users if missing
 
 
+# ----------------------------------------------------------------------------- #
+# Drop derived profile-completion data after a profile is saved.                #
+#                                                                               #
+# Clears the completion status memoized on the profile's user instance (see     #
+# BadgeService.get_profile_completion_status) and the cached badge progress,    #
+# whose Mission Ready progress counts completed profile fields.                 #
+#                                                                               #
+# Signal: post_save on UserProfile                                              #
+# ----------------------------------------------------------------------------- #
+@receiver(post_save, sender=UserProfile)
+def reset_profile_completion_on_profile_save(sender, instance, **kwargs):
+    from starview_app.services.badge_service import BadgeService
+
+    # Only a user instance this profile was loaded through can carry the memo
+    if UserProfile._meta.get_field('user').is_cached(instance):
+        instance.user.__dict__.pop('_profile_completion_status', None)
+    BadgeService.invalidate_badge_progress_cache_for_id(instance.user_id)
+
+
+# ----------------------------------------------------------------------------- #
+# Move the Pioneer badge cutoff when a user is deleted.                         #
+#                                                                               #
+# get_pioneer_cutoff() caches the date_joined of the PIONEER_LIMIT-th user;     #
+# deleting an earlier user (e.g. cleanup_unverified_users, account deletion)    #
+# lets the next user in, so the cached cutoff is dropped and recomputed.        #
+#                                                                               #
+# Signal: post_delete on User                                                   #
+# ----------------------------------------------------------------------------- #
+@receiver(post_delete, sender=User)
+def reset_pioneer_cutoff_on_user_delete(sender, instance, **kwargs):
+    from starview_app.services.badge_service import reset_pioneer_cutoff
+    reset_pioneer_cutoff(instance.date_joined)
+
+
 # ----------------------------------------------------------------------------- #
 # Delete EmailConfirmation and check Pioneer badge after email verification.    #
 #                                                                               #
@@ -379,6 +437,141 @@ def check_pioneer_badge_on_oauth(request, sociallogin, **kwargs):
     BadgeService.check_pioneer_badge(sociallogin.user)
 
 
+# ----------------------------------------------------------------------------------------------------- #
+#                                                                                                       #
+#                                   PROFILE ACTIVITY COUNTER SIGNALS                                    #
+#                                                                                                       #
+# Keep the denormalized UserProfile activity counters (read by badge checks) in step with their         #
+# source rows. Registered before the badge signals below so those already see the updated counts.       #
+# ----------------------------------------------------------------------------------------------------- #
+
+# Counter field per model, and the user whose counter a row belongs to (None = not counted)
+_ACTIVITY_COUNTERS = {
+    LocationVisit: ('visit_count', lambda visit: visit.user_id),
+    Location: ('locations_added_count', lambda location: location.added_by_id),
+    Follow: ('follower_count', lambda follow: follow.following_id),
+    # Only comments on OTHER users' reviews count toward community badges
+    ReviewComment: (
+        'other_comment_count',
+        lambda comment: comment.user_id if comment.review.user_id != comment.user_id else None
+    ),
+    ReviewPhoto: ('photo_count', lambda photo: photo.review.user_id),
+    LocationPhoto: ('photo_count', lambda photo: photo.uploaded_by_id),
+}
+
+
+def adjust_activity_counter(sender, instance, delta):
+    field, get_user_id = _ACTIVITY_COUNTERS[sender]
+    user_id = get_user_id(instance)
+    if user_id:
+        # Single UPDATE ... SET field = field + delta (atomic, no read-modify-write)
+        UserProfile.objects.filter(user_id=user_id).update(**{field: F(field) + delta})
+
+
+# ----------------------------------------------------------------------------- #
+# Increment the owner's activity counter when a counted row is created.         #
+#                                                                               #
+# Signal: post_save on LocationVisit, Location, Follow, ReviewComment,          #
+#         ReviewPhoto, LocationPhoto                                            #
+# ----------------------------------------------------------------------------- #
+@receiver(post_save, sender=LocationVisit)
+@receiver(post_save, sender=Location)
+@receiver(post_save, sender=Follow)
+@receiver(post_save, sender=ReviewComment)
+@receiver(post_save, sender=ReviewPhoto)
+@receiver(post_save, sender=LocationPhoto)
+def increment_activity_counter(sender, instance, created, **kwargs):
+    if created:
+        adjust_activity_counter(sender, instance, 1)
+
+
+# ----------------------------------------------------------------------------- #
+# Decrement the owner's activity counter when a counted row is deleted.         #
+#                                                                               #
+# Rows removed by a Location/Review CASCADE are skipped here (is_badge_cascade); #
+# the root's pre_delete below has already decremented their owners' counters.   #
+#                                                                               #
+# Signal: post_delete on LocationVisit, Location, Follow, ReviewComment,        #
+#         ReviewPhoto, LocationPhoto                                            #
+# ----------------------------------------------------------------------------- #
+@receiver(post_delete, sender=LocationVisit)
+@receiver(post_delete, sender=Location)
+@receiver(post_delete, sender=Follow)
+@receiver(post_delete, sender=ReviewComment)
+@receiver(post_delete, sender=ReviewPhoto)
+@receiver(post_delete, sender=LocationPhoto)
+def decrement_activity_counter(sender, instance, origin=None, **kwargs):
+    if is_badge_cascade(instance, origin):
+        return
+    adjust_activity_counter(sender, instance, -1)
+
+
+# Decrement counters for every counted row a CASCADE is about to delete. `counted` is
+# a list of (field, queryset, user field) - one grouped COUNT query each, then one
+# UPDATE per affected user (instead of a lookup + UPDATE per cascaded row)
+def decrement_cascaded_activity_counters(counted):
+    deltas = {}
+    for field, queryset, user_field in counted:
+        for user_id, count in queryset.order_by().values_list(user_field).annotate(count=Count('pk')):
+            user_deltas = deltas.setdefault(user_id, {})
+            user_deltas[field] = user_deltas.get(field, 0) + count
+
+    for user_id, user_deltas in deltas.items():
+        UserProfile.objects.filter(user_id=user_id).update(
+            **{field: F(field) - count for field, count in user_deltas.items()}
+        )
+
+
+# ----------------------------------------------------------------------------- #
+# Decrement counters for the rows a Location deletion CASCADEs to.              #
+#                                                                               #
+# Visits, comments on other users' reviews, review photos and gallery photos.   #
+#                                                                               #
+# Signal: pre_delete on Location                                                #
+# ----------------------------------------------------------------------------- #
+@receiver(pre_delete, sender=Location)
+def decrement_cascaded_counters_on_location_delete(sender, instance, origin=None, **kwargs):
+    if origin is not instance:
+        return
+
+    decrement_cascaded_activity_counters([
+        ('visit_count', LocationVisit.objects.filter(location=instance), 'user_id'),
+        (
+            'other_comment_count',
+            ReviewComment.objects.filter(review__location=instance).exclude(user_id=F('review__user_id')),
+            'user_id',
+        ),
+        ('photo_count', ReviewPhoto.objects.filter(review__location=instance), 'review__user_id'),
+        (
+            'photo_count',
+            LocationPhoto.objects.filter(location=instance, uploaded_by__isnull=False),
+            'uploaded_by_id',
+        ),
+    ])
+
+
+# ----------------------------------------------------------------------------- #
+# Decrement counters for the rows a Review deletion CASCADEs to.                #
+#                                                                               #
+# Comments by other users and the review's photos.                              #
+#                                                                               #
+# Signal: pre_delete on Review                                                  #
+# ----------------------------------------------------------------------------- #
+@receiver(pre_delete, sender=Review)
+def decrement_cascaded_counters_on_review_delete(sender, instance, origin=None, **kwargs):
+    if origin is not instance:
+        return
+
+    decrement_cascaded_activity_counters([
+        (
+            'other_comment_count',
+            ReviewComment.objects.filter(review=instance).exclude(user_id=instance.user_id),
+            'user_id',
+        ),
+        ('photo_count', ReviewPhoto.objects.filter(review=instance), 'review__user_id'),
+    ])
+
+
 # ----------------------------------------------------------------------------------------------------- #
 #                                                                                                       #
 #                                       BADGE CHECKING SIGNALS                                          #
@@ -394,6 +587,9 @@ def check_pioneer_badge_on_oauth(request, sociallogin, **kwargs):
 # Signal: post_save on LocationVisit                                            #
 # Badge Service: check_exploration_badges()                                     #
 # Cache Invalidation: Always invalidate (visit count changed)                   #
+#                                                                               #
+# Always runs inline (never queued): the mark-visited/toggle-visited responses  #
+# report the badges awarded here.                                               #
 # ----------------------------------------------------------------------------- #
 @receiver(post_save, sender=LocationVisit)
 def check_badges_on_visit(sender, instance, created, **kwargs):
@@ -418,8 +614,6 @@ def check_badges_on_visit(sender, instance, created, **kwargs):
 @receiver(post_save, sender=Location)
 def check_badges_on_location_add(sender, instance, created, **kwargs):
     if created:
-        from starview_app.services.badge_service import BadgeService
-
         # Auto-create LocationVisit when location created
         # (if you discovered and added it, you've obviously been there)
         LocationVisit.objects.get_or_create(
@@ -427,9 +621,7 @@ def check_badges_on_location_add(sender, instance, created, **kwargs):
             location=instance
         )
 
-        BadgeService.check_contribution_badges(instance.added_by)
-        # Invalidate cache (location count changed, affects progress)
-        BadgeService.invalidate_badge_progress_cache(instance.added_by)
+        queue_badge_checks(instance.added_by, 'contribution')
 
 
 # ----------------------------------------------------------------------------- #
@@ -447,8 +639,6 @@ def check_badges_on_location_add(sender, instance, created, **kwargs):
 @receiver(post_save, sender=Review)
 def check_badges_on_review(sender, instance, created, **kwargs):
     if created:
-        from starview_app.services.badge_service import BadgeService
-
         # Auto-create LocationVisit when review posted (review implies visit)
         LocationVisit.objects.get_or_create(
             user=instance.user,
@@ -456,15 +646,11 @@ def check_badges_on_review(sender, instance, created, **kwargs):
         )
 
         # Check review badges for the reviewer
-        BadgeService.check_review_badges(instance.user)
-        # Invalidate cache (review count changed, affects progress)
-        BadgeService.invalidate_badge_progress_cache(instance.user)
+        queue_badge_checks(instance.user, 'review')
 
         # Check quality badges for the location creator
         # (their location just got a new rating that may affect average)
-        BadgeService.check_quality_badges(instance.location.added_by)
-        # Invalidate cache (location rating changed, affects quality badges)
-        BadgeService.invalidate_badge_progress_cache(instance.location.added_by)
+        queue_badge_checks(instance.location.added_by, 'quality')
 
 
 # ----------------------------------------------------------------------------- #
@@ -480,11 +666,8 @@ def check_badges_on_review(sender, instance, created, **kwargs):
 @receiver(post_save, sender=Follow)
 def check_badges_on_follow(sender, instance, created, **kwargs):
     if created:
-        from starview_app.services.badge_service import BadgeService
         # Check badges for the user who GAINED a follower
-        BadgeService.check_community_badges(instance.following)
-        # Invalidate cache (follower count changed, affects progress)
-        BadgeService.invalidate_badge_progress_cache(instance.following)
+        queue_badge_checks(instance.following, 'community')
 
 
 # ----------------------------------------------------------------------------- #
@@ -500,10 +683,7 @@ def check_badges_on_follow(sender, instance, created, **kwargs):
 @receiver(post_save, sender=ReviewComment)
 def check_badges_on_comment(sender, instance, created, **kwargs):
     if created:
-        from starview_app.services.badge_service import BadgeService
-        BadgeService.check_community_badges(instance.user)
-        # Invalidate cache (comment count changed, affects progress)
-        BadgeService.invalidate_badge_progress_cache(instance.user)
+        queue_badge_checks(instance.user, 'community')
 
 
 # ----------------------------------------------------------------------------- #
@@ -519,8 +699,6 @@ def check_badges_on_comment(sender, instance, created, **kwargs):
 @receiver(post_save, sender=Vote)
 def check_badges_on_vote(sender, instance, created, **kwargs):
     if created:
-        from starview_app.services.badge_service import BadgeService
-
         # Only check badges if vote is on a Review
         # Use cached ContentType (no database query after first call)
         review_ct = get_review_content_type()
@@ -531,9 +709,7 @@ def check_badges_on_vote(sender, instance, created, **kwargs):
             # Use select_related to fetch user in same query
             try:
                 review = Review.objects.select_related('user').get(id=instance.object_id)
-                BadgeService.check_review_badges(review.user)
-                # Invalidate cache (vote count changed, affects review badges)
-                BadgeService.invalidate_badge_progress_cache(review.user)
+                queue_badge_checks(review.user, 'review')
             except Review.DoesNotExist:
                 # Vote on deleted review, skip badge check
                 pass
@@ -552,11 +728,8 @@ def check_badges_on_vote(sender, instance, created, **kwargs):
 @receiver(post_save, sender=ReviewPhoto)
 def check_badges_on_review_photo_upload(sender, instance, created, **kwargs):
     if created:
-        from starview_app.services.badge_service import BadgeService
         # Check Photographer badge for the user who uploaded the photo
-        BadgeService.check_photographer_badge(instance.review.user)
-        # Invalidate cache (photo count changed, affects photographer badge)
-        BadgeService.invalidate_badge_progress_cache(instance.review.user)
+        queue_badge_checks(instance.review.user, 'photographer')
 
 
 # ----------------------------------------------------------------------------- #
@@ -572,19 +745,78 @@ def check_badges_on_review_photo_upload(sender, instance, created, **kwargs):
 @receiver(post_save, sender=LocationPhoto)
 def check_badges_on_location_photo_upload(sender, instance, created, **kwargs):
     if created and instance.uploaded_by:
-        from starview_app.services.badge_service import BadgeService
         # Check Photographer badge for the user who uploaded the photo
-        BadgeService.check_photographer_badge(instance.uploaded_by)
-        # Invalidate cache (photo count changed, affects photographer badge)
-        BadgeService.invalidate_badge_progress_cache(instance.uploaded_by)
+        queue_badge_checks(instance.uploaded_by, 'photographer')
 
 
 # ----------------------------------------------------------------------------------------------------- #
 #                                                                                                       #
 #                                   BADGE REVOCATION SIGNALS (DELETIONS)                                #
 #                                                                                                       #
+# Deleting a Location or Review CASCADEs to many rows (visits, reviews, comments, photos, votes).       #
+# Those rows skip their own handlers below (is_badge_cascade); instead the users they belonged to are   #
+# noted before the CASCADE and each is re-checked once afterwards (recompute_all_revocations).          #
 # ----------------------------------------------------------------------------------------------------- #
 
+# Whether a deleted row is part of a Location/Review CASCADE (`origin` is the instance
+# whose delete() was called) - its badges are re-checked by the root's handler
+def is_badge_cascade(instance, origin):
+    return (
+        isinstance(origin, (Location, Review)) and
+        not (type(origin) is type(instance) and origin.pk == instance.pk)
+    )
+
+
+# Re-check every count-based badge for each of `user_ids` (one query for the users,
+# then 2 per user)
+def recompute_badges_for_users(user_ids):
+    from starview_app.services.badge_service import BadgeService
+    for user in User.objects.filter(pk__in=user_ids):
+        BadgeService.recompute_all_revocations(user)
+
+
+# ----------------------------------------------------------------------------- #
+# Note the users a Location deletion affects, before its CASCADE runs.          #
+#                                                                               #
+# Location creator, visitors, reviewers (reviews, review photos and votes),     #
+# commenters on its reviews and gallery photo uploaders - in one UNION query.   #
+# Stored on the instance for revoke_badges_on_location_delete().                #
+#                                                                               #
+# Signal: pre_delete on Location                                                #
+# ----------------------------------------------------------------------------- #
+@receiver(pre_delete, sender=Location)
+def collect_badge_users_on_location_delete(sender, instance, origin=None, **kwargs):
+    if origin is not instance:
+        return
+
+    # order_by(): model default orderings are not allowed inside a UNION
+    affected = LocationVisit.objects.filter(location=instance).order_by().values_list('user_id', flat=True).union(
+        Review.objects.filter(location=instance).order_by().values_list('user_id', flat=True),
+        ReviewComment.objects.filter(review__location=instance).order_by().values_list('user_id', flat=True),
+        LocationPhoto.objects.filter(
+            location=instance, uploaded_by__isnull=False
+        ).order_by().values_list('uploaded_by_id', flat=True),
+    )
+    instance._badge_user_ids = {instance.added_by_id, *affected}
+
+
+# ----------------------------------------------------------------------------- #
+# Note the users a Review deletion affects, before its CASCADE runs.            #
+#                                                                               #
+# Reviewer (review, photos and votes), location creator (rating changed) and    #
+# commenters. Stored on the instance for revoke_badges_on_review_delete().      #
+#                                                                               #
+# Signal: pre_delete on Review                                                  #
+# ----------------------------------------------------------------------------- #
+@receiver(pre_delete, sender=Review)
+def collect_badge_users_on_review_delete(sender, instance, origin=None, **kwargs):
+    if origin is not instance:
+        return
+
+    commenters = ReviewComment.objects.filter(review=instance).values_list('user_id', flat=True)
+    instance._badge_user_ids = {instance.user_id, instance.location.added_by_id, *commenters}
+
+
 # ----------------------------------------------------------------------------- #
 # Revoke badges when LocationVisit is deleted.                                  #
 #                                                                               #
@@ -595,7 +827,9 @@ def check_badges_on_location_photo_upload(sender, instance, created, **kwargs):
 # Badge Service: revoke_exploration_badges_if_needed()                          #
 # ----------------------------------------------------------------------------- #
 @receiver(post_delete, sender=LocationVisit)
-def revoke_badges_on_visit_delete(sender, instance, **kwargs):
+def revoke_badges_on_visit_delete(sender, instance, origin=None, **kwargs):
+    if is_badge_cascade(instance, origin):
+        return
     from starview_app.services.badge_service import BadgeService
     BadgeService.revoke_exploration_badges_if_needed(instance.user)
 
@@ -604,13 +838,21 @@ def revoke_badges_on_visit_delete(sender, instance, **kwargs):
 # Revoke badges when Location is deleted.                                       #
 #                                                                               #
 # Triggered when Location is deleted.                                           #
-# Checks if user still qualifies for contribution badges they have.             #
+# Re-checks every user noted by collect_badge_users_on_location_delete(), or    #
+# just the creator's contribution badges when deleted in bulk (queryset) or     #
+# by another CASCADE.                                                           #
 #                                                                               #
 # Signal: post_delete on Location                                               #
-# Badge Service: revoke_contribution_badges_if_needed()                         #
+# Badge Service: recompute_all_revocations(),                                   #
+#                revoke_contribution_badges_if_needed()                         #
 # ----------------------------------------------------------------------------- #
 @receiver(post_delete, sender=Location)
 def revoke_badges_on_location_delete(sender, instance, **kwargs):
+    user_ids = getattr(instance, '_badge_user_ids', None)
+    if user_ids is not None:
+        recompute_badges_for_users(user_ids)
+        return
+
     from starview_app.services.badge_service import BadgeService
     BadgeService.revoke_contribution_badges_if_needed(instance.added_by)
 
@@ -619,22 +861,41 @@ def revoke_badges_on_location_delete(sender, instance, **kwargs):
 # Revoke badges when Review is deleted.                                         #
 #                                                                               #
 # Triggered when Review is deleted.                                             #
-# Checks if:                                                                    #
+# Re-checks every user noted by collect_badge_users_on_review_delete().         #
+# When deleted in bulk (queryset) or by another CASCADE, checks if:             #
 # 1. Reviewer still qualifies for review badges                                 #
 # 2. Location creator still qualifies for quality badges (rating changed)       #
 #                                                                               #
+# Both checks share one revoke_badges_if_needed() pass when the reviewer added  #
+# the location themselves.                                                      #
+#                                                                               #
 # Signal: post_delete on Review                                                 #
 # Badge Service: revoke_review_badges_if_needed(), revoke_quality_badges()      #
 # ----------------------------------------------------------------------------- #
 @receiver(post_delete, sender=Review)
-def revoke_badges_on_review_delete(sender, instance, **kwargs):
+def revoke_badges_on_review_delete(sender, instance, origin=None, **kwargs):
+    if is_badge_cascade(instance, origin):
+        return
+
+    user_ids = getattr(instance, '_badge_user_ids', None)
+    if user_ids is not None:
+        recompute_badges_for_users(user_ids)
+        return
+
     from starview_app.services.badge_service import BadgeService
 
+    location_owner = instance.location.added_by
+
+    # Reviewer is also the location creator: one pass (one count query, one DELETE)
+    if location_owner.id == instance.user_id:
+        BadgeService.revoke_badges_if_needed(instance.user, ('REVIEW', 'QUALITY'))
+        return
+
     # Check review badges for the reviewer
     BadgeService.revoke_review_badges_if_needed(instance.user)
 
     # Check quality badges for the location creator (rating average changed)
-    BadgeService.revoke_quality_badges_if_needed(instance.location.added_by)
+    BadgeService.revoke_quality_badges_if_needed(location_owner)
 
 
 # ----------------------------------------------------------------------------- #
@@ -647,7 +908,9 @@ def revoke_badges_on_review_delete(sender, instance, **kwargs):
 # Badge Service: revoke_community_badges_if_needed()                            #
 # ----------------------------------------------------------------------------- #
 @receiver(post_delete, sender=ReviewComment)
-def revoke_badges_on_comment_delete(sender, instance, **kwargs):
+def revoke_badges_on_comment_delete(sender, instance, origin=None, **kwargs):
+    if is_badge_cascade(instance, origin):
+        return
     from starview_app.services.badge_service import BadgeService
     BadgeService.revoke_community_badges_if_needed(instance.user)
 
@@ -678,7 +941,10 @@ def revoke_badges_on_unfollow(sender, instance, **kwargs):
 # Badge Service: revoke_review_badges_if_needed()                               #
 # ----------------------------------------------------------------------------- #
 @receiver(post_delete, sender=Vote)
-def revoke_badges_on_vote_delete(sender, instance, **kwargs):
+def revoke_badges_on_vote_delete(sender, instance, origin=None, **kwargs):
+    if is_badge_cascade(instance, origin):
+        return
+
     from starview_app.services.badge_service import BadgeService
 
     # Only check badges if vote is on a Review
@@ -707,7 +973,9 @@ def revoke_badges_on_vote_delete(sender, instance, **kwargs):
 # Badge Service: revoke_photographer_badge_if_needed()                          #
 # ----------------------------------------------------------------------------- #
 @receiver(post_delete, sender=ReviewPhoto)
-def revoke_badges_on_review_photo_delete(sender, instance, **kwargs):
+def revoke_badges_on_review_photo_delete(sender, instance, origin=None, **kwargs):
+    if is_badge_cascade(instance, origin):
+        return
     from starview_app.services.badge_service import BadgeService
     BadgeService.revoke_photographer_badge_if_needed(instance.review.user)
 
@@ -722,12 +990,29 @@ def revoke_badges_on_review_photo_delete(sender, instance, **kwargs):
 # Badge Service: revoke_photographer_badge_if_needed()                          #
 # ----------------------------------------------------------------------------- #
 @receiver(post_delete, sender=LocationPhoto)
-def revoke_badges_on_location_photo_delete(sender, instance, **kwargs):
+def revoke_badges_on_location_photo_delete(sender, instance, origin=None, **kwargs):
+    if is_badge_cascade(instance, origin):
+        return
     if instance.uploaded_by:
         from starview_app.services.badge_service import BadgeService
         BadgeService.revoke_photographer_badge_if_needed(instance.uploaded_by)
 
 
+# ----------------------------------------------------------------------------- #
+# Reload the badge catalog after a badge is added, edited, or removed.          #
+#                                                                               #
+# Badge checks read a per-process memoized catalog (see badge_service.py), so   #
+# admin edits must drop it to take effect in this process.                      #
+#                                                                               #
+# Signal: post_save / post_delete on Badge                                      #
+# ----------------------------------------------------------------------------- #
+@receiver(post_save, sender=Badge)
+@receiver(post_delete, sender=Badge)
+def reset_badge_caches_on_badge_change(sender, instance, **kwargs):
+    from starview_app.services.badge_service import reset_badge_caches
+    reset_badge_caches()
+
+
 # ----------------------------------------------------------------------------------------------------- #
 #                                                                                                       #
 #                                  REVIEW SUMMARY STALENESS SIGNALS                                     #
@@ -78,14 +78,16 @@ def enrich_location_data(self, location_id):
                 'reason': 'DISABLE_EXTERNAL_APIS is True'
             }
 
-        # Track which fields were successfully enriched
+        # Track which fields were successfully enriched (saved together at the end)
         enriched_fields = []
+        updated_fields = []
 
         # Enrich address from coordinates
         try:
-            address_success = LocationService.update_address_from_coordinates(location)
+            address_success = LocationService.update_address_from_coordinates(location, commit=False)
             if address_success:
                 enriched_fields.append('address')
+                updated_fields += LocationService.ADDRESS_FIELDS
                 logger.info("Address enriched for location %s: %s", location_id, location.formatted_address)
             else:
                 logger.warning("Address enrichment failed for location %s", location_id)
@@ -95,15 +97,20 @@ def enrich_location_data(self, location_id):
 
         # Enrich elevation from Mapbox
         try:
-            elevation_success = LocationService.update_elevation_from_mapbox(location)
+            elevation_success = LocationService.update_elevation_from_mapbox(location, commit=False)
             if elevation_success:
                 enriched_fields.append('elevation')
+                updated_fields += LocationService.ELEVATION_FIELDS
                 logger.info("Elevation enriched for location %s: %sm", location_id, location.elevation)
             else:
                 logger.warning("Elevation enrichment failed for location %s", location_id)
         except Exception as e:
             logger.error("Error enriching elevation for location %s: %s", location_id, e)
 
+        # Write all enriched fields with a single UPDATE
+        if updated_fields:
+            location.save(update_fields=updated_fields)
+
         # Return success with enriched fields
         result = {
             'status': 'success',
@@ -232,3 +239,32 @@ def generate_review_summary(self, location_id):
                 'location_id': location_id,
                 'error': f'Max retries exceeded: {str(exc)}'
             }
+
+
+# ----------------------------------------------------------------------------- #
+# Runs badge checks for a user in the background.                               #
+#                                                                               #
+# Queued by badge signal handlers (after the triggering transaction commits)    #
+# when CELERY_ENABLED=True, so badge counting and awarding stay off the         #
+# request/response path.                                                        #
+#                                                                               #
+# Args:                                                                         #
+#   user_id (int): The ID of the User to check badges for                       #
+#   categories (list): Check names understood by check_all_for_user()           #
+#                                                                               #
+# Returns:                                                                      #
+#   dict: Status and IDs of newly awarded badges                                #
+# ----------------------------------------------------------------------------- #
+@shared_task
+def check_user_badges(user_id, categories):
+    from django.contrib.auth.models import User
+    from starview_app.services.badge_service import BadgeService
+
+    user = User.objects.filter(id=user_id).first()
+    if user is None:
+        # User was deleted before the check ran
+        logger.warning("Skipping badge check for missing user %s", user_id)
+        return {'status': 'skipped', 'user_id': user_id}
+
+    newly_awarded = BadgeService.check_all_for_user(user, categories)
+    return {'status': 'success', 'user_id': user_id, 'newly_awarded': newly_awarded}
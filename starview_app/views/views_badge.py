@@ -45,7 +45,9 @@ from starview_app.services.badge_service import BadgeService
 @api_view(['GET'])
 @permission_classes([AllowAny])
 def get_user_badges(request, username):
-    user = get_object_or_404(User, username=username)
+    # Join the profile: read for pinned badges on every call and for profile
+    # completion progress on a cache miss
+    user = get_object_or_404(User.objects.select_related('userprofile'), username=username)
 
     # Get badge progress from service
     badge_data = BadgeService.get_user_badge_progress(user)
@@ -16,13 +16,15 @@
 # Import tools:
 from rest_framework import viewsets
 from rest_framework.permissions import IsAuthenticated
-from django.db.models import Avg, Count
+from django.db.models import Avg, Count, Prefetch
 
 # Import models:
 from ..models import FavoriteLocation
+from ..models import Review
 
 # Import serializers:
 from ..serializers import FavoriteLocationSerializer
+from ..serializers import ReviewSerializer
 
 
 
@@ -49,11 +51,11 @@ class FavoriteLocationViewSet(viewsets.ModelViewSet):
             'location__verified_by',
             'user'
         ).prefetch_related(
-            'location__reviews__user',
-            'location__reviews__photos',
-            'location__reviews__votes',  # Prefetch votes for reviews
-            'location__reviews__comments__user',
-            'location__reviews__comments__votes'  # Prefetch votes for comments
+            # ReviewSerializer owns the joins it needs (profile, photos, votes)
+            Prefetch(
+                'location__reviews',
+                queryset=ReviewSerializer.prefetch_queryset(Review.objects.all())
+            )
         )
 
         # Add annotations to the nested location objects
@@ -28,7 +28,7 @@ from rest_framework.response import Response
 from ..models import Follow
 
 # Serializer imports:
-from ..serializers import PublicUserSerializer
+from ..serializers import public_user_values, serialize_public_user_rows
 
 
 
@@ -141,14 +141,13 @@ def get_followers(request, username):
     if hasattr(user, 'userprofile') and user.userprofile.is_system_account:
         raise exceptions.NotFound("User not found.")
 
-    # Get all users who follow this user (excluding system accounts)
-    followers = Follow.objects.filter(
-        following=user,
-        follower__userprofile__is_system_account=False
-    ).select_related('follower__userprofile')
-
-    # Extract the follower users
-    follower_users = [follow.follower for follow in followers]
+    # Get all users who follow this user (excluding system accounts), most recent first
+    follower_users = public_user_values(
+        User.objects.filter(
+            following__following=user,
+            userprofile__is_system_account=False
+        )
+    ).order_by('-following__created_at')
 
     # Pagination
     from rest_framework.pagination import PageNumberPagination
@@ -156,8 +155,9 @@ def get_followers(request, username):
     paginator.page_size = 20
     paginated_followers = paginator.paginate_queryset(follower_users, request)
 
-    serializer = PublicUserSerializer(paginated_followers, many=True, context={'request': request})
-    return paginator.get_paginated_response(serializer.data)
+    # Flat .values() rows shaped like PublicUserSerializer (no model instances)
+    data = serialize_public_user_rows(paginated_followers, {'request': request})
+    return paginator.get_paginated_response(data)
 
 
 # ----------------------------------------------------------------------------- #
@@ -178,14 +178,13 @@ def get_following(request, username):
     if hasattr(user, 'userprofile') and user.userprofile.is_system_account:
         raise exceptions.NotFound("User not found.")
 
-    # Get all users that this user follows (excluding system accounts)
-    following = Follow.objects.filter(
-        follower=user,
-        following__userprofile__is_system_account=False
-    ).select_related('following__userprofile')
-
-    # Extract the following users
-    following_users = [follow.following for follow in following]
+    # Get all users that this user follows (excluding system accounts), most recent first
+    following_users = public_user_values(
+        User.objects.filter(
+            followers__follower=user,
+            userprofile__is_system_account=False
+        )
+    ).order_by('-followers__created_at')
 
     # Pagination
     from rest_framework.pagination import PageNumberPagination
@@ -193,5 +192,6 @@ def get_following(request, username):
     paginator.page_size = 20
     paginated_following = paginator.paginate_queryset(following_users, request)
 
-    serializer = PublicUserSerializer(paginated_following, many=True, context={'request': request})
-    return paginator.get_paginated_response(serializer.data)
+    # Flat .values() rows shaped like PublicUserSerializer (no model instances)
+    data = serialize_public_user_rows(paginated_following, {'request': request})
+    return paginator.get_paginated_response(data)
@@ -44,6 +44,8 @@ from django.db.models import Prefetch
 # Serializer imports:
 from ..serializers import LocationSerializer
 from ..serializers import LocationInfoPanelSerializer
+from ..serializers import ReviewSerializer
+from ..serializers import recent_reviews_prefetch
 
 # Service imports:
 from ..services import ReportService
@@ -146,12 +148,12 @@ class LocationViewSet(viewsets.ModelViewSet):
 
         # For detail view, prefetch nested reviews with votes to avoid N+1
         if self.action == 'retrieve':
+            # (ReviewSerializer owns the joins it needs: profile, photos, votes)
             queryset = queryset.prefetch_related(
-                'reviews__user',
-                'reviews__photos',
-                'reviews__votes',  # Prefetch votes for reviews
-                'reviews__comments__user',
-                'reviews__comments__votes'  # Prefetch votes for comments
+                Prefetch(
+                    'reviews',
+                    queryset=ReviewSerializer.prefetch_queryset(Review.objects.all())
+                )
             )
         elif self.action == 'list':
             # For list view, prefetch photos for image carousel
@@ -161,17 +163,7 @@ class LocationViewSet(viewsets.ModelViewSet):
                     queryset=LocationPhoto.objects.order_by('-created_at'),
                     to_attr='prefetched_location_photos'
                 ),
-                Prefetch(
-                    'reviews',
-                    queryset=Review.objects.order_by('-created_at').prefetch_related(
-                        Prefetch(
-                            'photos',
-                            queryset=ReviewPhoto.objects.order_by('order'),
-                            to_attr='prefetched_photos'
-                        )
-                    ),
-                    to_attr='prefetched_reviews'
-                )
+                recent_reviews_prefetch()
             )
 
         # Add is_favorited annotation for authenticated users
@@ -593,17 +585,7 @@ class LocationViewSet(viewsets.ModelViewSet):
                 queryset=LocationPhoto.objects.order_by('-created_at'),
                 to_attr='prefetched_location_photos'
             ),
-            Prefetch(
-                'reviews',
-                queryset=Review.objects.order_by('-created_at').prefetch_related(
-                    Prefetch(
-                        'photos',
-                        queryset=ReviewPhoto.objects.order_by('order'),
-                        to_attr='prefetched_photos'
-                    )
-                ),
-                to_attr='prefetched_reviews'
-            )
+            recent_reviews_prefetch()
         )
 
         # Add is_favorited annotation for authenticated users
@@ -1033,17 +1015,7 @@ class LocationViewSet(viewsets.ModelViewSet):
                 queryset=LocationPhoto.objects.order_by('-created_at'),
                 to_attr='prefetched_location_photos'
             ),
-            Prefetch(
-                'reviews',
-                queryset=Review.objects.order_by('-created_at').prefetch_related(
-                    Prefetch(
-                        'photos',
-                        queryset=ReviewPhoto.objects.order_by('order'),
-                        to_attr='prefetched_photos'
-                    )
-                ),
-                to_attr='prefetched_reviews'
-            )
+            recent_reviews_prefetch()
         ).order_by('distance_km')[:limit]
 
         # Add is_favorited annotation for authenticated users
@@ -1069,17 +1041,7 @@ class LocationViewSet(viewsets.ModelViewSet):
                     queryset=LocationPhoto.objects.order_by('-created_at'),
                     to_attr='prefetched_location_photos'
                 ),
-                Prefetch(
-                    'reviews',
-                    queryset=Review.objects.order_by('-created_at').prefetch_related(
-                        Prefetch(
-                            'photos',
-                            queryset=ReviewPhoto.objects.order_by('order'),
-                            to_attr='prefetched_photos'
-                        )
-                    ),
-                    to_attr='prefetched_reviews'
-                )
+                recent_reviews_prefetch()
             ).order_by('distance_km')[:limit]
 
         # Serialize using LocationListSerializer
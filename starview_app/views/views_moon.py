@@ -15,7 +15,7 @@
 # - Optional lat/lng parameters enable location-specific moonrise/moonset times                       #
 # ----------------------------------------------------------------------------------------------------- #
 
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 
 from django.core.cache import cache
 from django.http import JsonResponse
@@ -24,6 +24,8 @@ from ..services.moon_service import (
     get_moon_data_unified,
     get_next_key_dates,
     get_key_dates_in_range,
+    get_phase_for_date,
+    get_phase_summary,
 )
 from ..utils.cache import (
     moon_cache_key,
@@ -156,19 +158,9 @@ def get_moon_phases(request):
     if cached_data:
         # Always refresh 'current' section for real-time accuracy
         # The cached 'daily' data is still valid, but 'current' should be live
-        from ..services.moon_service import get_phase_for_date
-        from datetime import timezone as tz
-        now = datetime.now(tz.utc)
+        now = datetime.now(timezone.utc)
         current_phase = get_phase_for_date(now, lat, lng)
-        cached_data['current'] = {
-            'timestamp': now.isoformat(),
-            'phase_name': current_phase.get('phase_name'),
-            'phase_emoji': current_phase.get('phase_emoji'),
-            'illumination': current_phase.get('illumination'),
-            'phase_angle': current_phase.get('phase_angle'),
-            'is_waning': current_phase.get('is_waning'),
-            'is_good_for_stargazing': current_phase.get('is_good_for_stargazing'),
-        }
+        cached_data['current'] = {'timestamp': now.isoformat(), **get_phase_summary(current_phase)}
         # Add location-specific fields if available
         if current_phase.get('next_moonrise'):
             cached_data['current']['next_moonrise'] = current_phase['next_moonrise']
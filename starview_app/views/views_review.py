@@ -106,21 +106,12 @@ class ReviewViewSet(viewsets.ModelViewSet):
 
     # Filter reviews by location from URL parameters:
     def get_queryset(self):
-        from django.contrib.contenttypes.models import ContentType
-        from starview_app.models import Vote
-
+        # Serializer owns its joins (profile, photos, votes) to avoid N+1 queries
         queryset = Review.objects.filter(
             location_id=self.kwargs['location_pk']
-        ).select_related(
-            'user',
-            'location'
-        ).prefetch_related(
-            'photos',
-            'comments__user',
-            'votes'  # Prefetch votes to avoid N+1 in get_user_vote()
-        )
+        ).select_related('location')
 
-        return queryset
+        return ReviewSerializer.prefetch_queryset(queryset)
 
 
     # ----------------------------------------------------------------------------- #
@@ -334,15 +325,12 @@ class CommentViewSet(viewsets.ModelViewSet):
 
     # Filter comments by review from URL parameters:
     def get_queryset(self):
-        return ReviewComment.objects.filter(
+        # Serializer owns its joins (profile, votes) to avoid N+1 queries
+        queryset = ReviewComment.objects.filter(
             review_id=self.kwargs['review_pk']
-        ).select_related(
-            'user',
-            'user__userprofile',
-            'review'
-        ).prefetch_related(
-            'votes'  # Prefetch votes to avoid N+1 in get_user_vote()
-        )
+        ).select_related('review')
+
+        return ReviewCommentSerializer.prefetch_queryset(queryset)
 
 
     # Create a comment for a specific review:
@@ -120,7 +120,7 @@ class UserProfileViewSet(viewsets.ModelViewSet):
     # Returns: PublicUserSerializer data                                            #
     # ----------------------------------------------------------------------------- #
     def retrieve(self, request, username=None):
-        user = get_object_or_404(User.objects.select_related('userprofile'), username=username)
+        user = get_object_or_404(PublicUserSerializer.prefetch_queryset(User.objects.all()), username=username)
         # Hide system accounts from public access
         if hasattr(user, 'userprofile') and user.userprofile.is_system_account:
             raise exceptions.NotFound('User not found.')
@@ -144,7 +144,9 @@ class UserProfileViewSet(viewsets.ModelViewSet):
         # Hide system accounts from public access
         if hasattr(user, 'userprofile') and user.userprofile.is_system_account:
             raise exceptions.NotFound('User not found.')
-        reviews = Review.objects.filter(user=user).select_related('location', 'user__userprofile').order_by('-created_at')
+        reviews = ReviewSerializer.prefetch_queryset(
+            Review.objects.filter(user=user).select_related('location')
+        ).order_by('-created_at')
 
         # Pagination
         from rest_framework.pagination import PageNumberPagination
@@ -216,7 +218,7 @@ class UserProfileViewSet(viewsets.ModelViewSet):
 
         # Save the new profile picture
         user_profile.profile_picture = profile_picture
-        user_profile.save()
+        user_profile.save(update_fields=['profile_picture', 'updated_at'])
 
         # Check profile completion badge (may award Mission Ready)
         from starview_app.services.badge_service import BadgeService
@@ -247,7 +249,7 @@ class UserProfileViewSet(viewsets.ModelViewSet):
 
         # Reset to default (model returns default URL when profile_picture is None)
         user_profile.profile_picture = None
-        user_profile.save()
+        user_profile.save(update_fields=['profile_picture', 'updated_at'])
 
         # Check profile completion badge (may revoke Mission Ready)
         from starview_app.services.badge_service import BadgeService
@@ -534,7 +536,7 @@ class UserProfileViewSet(viewsets.ModelViewSet):
         # Update bio
         profile = request.user.userprofile
         profile.bio = bio
-        profile.save()
+        profile.save(update_fields=['bio', 'updated_at'])
 
         # Check profile completion badge (may award/revoke Mission Ready)
         from starview_app.services.badge_service import BadgeService
@@ -571,7 +573,7 @@ class UserProfileViewSet(viewsets.ModelViewSet):
         # Update preference
         profile = request.user.userprofile
         profile.unit_preference = unit_preference
-        profile.save()
+        profile.save(update_fields=['unit_preference', 'updated_at'])
 
         return Response({
             'detail': 'Unit preference updated successfully.',
@@ -607,7 +609,7 @@ class UserProfileViewSet(viewsets.ModelViewSet):
         # Update preference
         profile = request.user.userprofile
         profile.language_preference = language_preference
-        profile.save()
+        profile.save(update_fields=['language_preference', 'updated_at'])
 
         # Update session language for immediate effect
         request.session['django_language'] = language_preference